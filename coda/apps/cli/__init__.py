@@ -7,4 +7,22 @@ Requires: coda.base.config, coda.base.theme, coda.base.providers, coda.base.sear
 
 from .main import main
 
-__all__ = ["main"]
+# Heavier submodules are imported on first attribute access
+_LAZY_ATTRS = {
+    "CLIErrorHandler": ".error_handler",
+    "ProviderManager": ".provider_manager",
+}
+
+__all__ = ["main", *_LAZY_ATTRS]
+
+
+def __getattr__(name: str):
+    """Import CLI components from their submodules on first access."""
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    globals()[name] = value
+    return value
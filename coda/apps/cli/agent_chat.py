@@ -8,6 +8,25 @@ from coda.services.agents.builtin_tools import get_builtin_tools
 from coda.services.agents.tool_adapter import MCPToolAdapter
 
 from .agent_event_handler import CLIAgentEventHandler
+from .utils import StreamWriter
+
+# Agent instructions used when no mode-specific system prompt is given
+DEFAULT_INSTRUCTIONS = """You are a helpful AI assistant with access to various tools.
+
+IMPORTANT: Only use tools when they are necessary to complete the user's request. Many requests can be answered directly without tools:
+- Writing (poems, stories, jokes, explanations)
+- General knowledge questions
+- Math calculations you can do mentally
+- Coding questions and explanations
+- Casual conversation
+
+Use tools ONLY when you need to:
+- Access files or directories
+- Execute commands
+- Fetch real-time information
+- Perform operations you cannot do directly
+
+Each user request should be evaluated independently. Previous tool usage does not mean future requests require tools."""
 
 
 class AgentChatHandler:
@@ -19,6 +38,7 @@ class AgentChatHandler:
         self.cli = cli
         self.console = console
         self.agent = None
+        self.event_handler = None
         self.use_tools = True
         from coda.services.config import get_config_service
 
@@ -62,39 +82,35 @@ class AgentChatHandler:
         Returns:
             Tuple of (final_response, updated_messages)
         """
-        # Create or update agent
-        if self.agent is None or self.agent.model != model:
+        # Create or update agent; it is kept while the model, instructions (which
+        # follow the developer mode) and sampling settings are unchanged, so tools
+        # are not re-processed per turn
+        instructions = system_prompt or DEFAULT_INSTRUCTIONS
+        if (
+            self.agent is None
+            or self.agent.model != model
+            or self.agent.instructions != instructions
+            or self.agent.temperature != temperature
+            or self.agent.max_tokens != max_tokens
+        ):
             tools = self.get_available_tools() if self.should_use_agent(model) else []
 
             # Create event handler
-            event_handler = CLIAgentEventHandler(self.console, self.theme_manager)
+            self.event_handler = CLIAgentEventHandler(self.console, self.theme_manager)
 
             self.agent = Agent(
                 provider=self.provider,
                 model=model,
-                instructions=system_prompt
-                or """You are a helpful AI assistant with access to various tools.
-
-IMPORTANT: Only use tools when they are necessary to complete the user's request. Many requests can be answered directly without tools:
-- Writing (poems, stories, jokes, explanations)
-- General knowledge questions
-- Math calculations you can do mentally
-- Coding questions and explanations
-- Casual conversation
-
-Use tools ONLY when you need to:
-- Access files or directories
-- Execute commands
-- Fetch real-time information
-- Perform operations you cannot do directly
-
-Each user request should be evaluated independently. Previous tool usage does not mean future requests require tools.""",
+                instructions=instructions,
                 tools=tools,
                 name="Coda Assistant",
                 temperature=temperature,
                 max_tokens=max_tokens,
-                event_handler=event_handler,
+                event_handler=self.event_handler,
             )
+        else:
+            # Don't let a previous turn's unfinished output leak into this one
+            self.event_handler.finalize()
 
         # Extract user input from last message
         user_input = messages[-1].content if messages and messages[-1].role == "user" else ""
@@ -107,13 +123,12 @@ Each user request should be evaluated independently. Previous tool usage does no
                     f"[{self.console_theme.bold} {self.console_theme.info}]Thinking...[/{self.console_theme.bold} {self.console_theme.info}]"
                 )
 
-            # Create interrupt check function
+            # Create interrupt check function; the CLI's event is created once, so
+            # resolve it here rather than on every check during streaming
+            interrupt_event = getattr(self.cli, "interrupt_event", None)
+
             def check_interrupt():
-                return (
-                    self.cli is not None
-                    and hasattr(self.cli, "interrupt_event")
-                    and self.cli.interrupt_event.is_set()
-                )
+                return interrupt_event is not None and interrupt_event.is_set()
 
             response_content, updated_messages = await self.agent.run_async_streaming(
                 input=user_input,
@@ -132,6 +147,11 @@ Each user request should be evaluated independently. Previous tool usage does no
             )
             return error_msg, messages
 
+        finally:
+            # An interrupted stream returns without RESPONSE_COMPLETE; close its
+            # live display and buffer so the next turn starts clean
+            self.event_handler.finalize()
+
     async def stream_chat_fallback(
         self,
         messages: list[Message],
@@ -140,8 +160,9 @@ Each user request should be evaluated independently. Previous tool usage does no
         max_tokens: int = 2000,
     ) -> str:
         """Fallback streaming chat without agent/tools."""
-        full_response = ""
+        response_parts = []
         first_chunk = True
+        writer = StreamWriter(self.console)
 
         try:
             stream = self.provider.chat_stream(
@@ -151,6 +172,10 @@ Each user request should be evaluated independently. Previous tool usage does no
                 max_tokens=max_tokens,
             )
 
+            # Bind per-chunk callables to locals for the hot loop
+            write = writer.write
+            append_part = response_parts.append
+            interrupt_event = getattr(self.cli, "interrupt_event", None)
             for chunk in stream:
                 if first_chunk:
                     self.console.print(
@@ -160,25 +185,30 @@ Each user request should be evaluated independently. Previous tool usage does no
                     first_chunk = False
 
                 # Check for interrupt
-                if hasattr(self.cli, "interrupt_event") and self.cli.interrupt_event.is_set():
+                if interrupt_event is not None and interrupt_event.is_set():
+                    writer.flush()
                     self.console.print(
                         f"\n\n[{self.console_theme.warning}]Response interrupted by user[/{self.console_theme.warning}]"
                     )
                     break
 
-                self.console.print(chunk.content, end="")
-                full_response += chunk.content
+                content = chunk.content
+                write(content)
+                append_part(content)
+
+            writer.flush()
 
             # Add newline after streaming
-            if full_response:
+            if any(response_parts):
                 self.console.print()
 
         except Exception as e:
+            writer.flush()
             self.console.print(
                 f"\n[{self.console_theme.error}]Error during streaming: {str(e)}[/{self.console_theme.error}]"
             )
 
-        return full_response
+        return "".join(response_parts)
 
     def toggle_tools(self) -> bool:
         """Toggle tool usage on/off."""
@@ -1,11 +1,10 @@
 """CLI event handler for agent events."""
 
 import json
+import time
 
 from rich.live import Live
-from rich.markdown import Markdown
 from rich.panel import Panel
-from rich.syntax import Syntax
 
 from coda.services.agents.agent_types import AgentEvent, AgentEventHandler, AgentEventType
 
@@ -27,12 +26,12 @@ class CLIAgentEventHandler(AgentEventHandler):
             )
         elif event.type == AgentEventType.TOOL_EXECUTION_START:
             # Finalize any existing markdown buffer before tool output
-            if self.markdown_buffer:
-                self.markdown_buffer.finalize()
-                self.markdown_buffer = None
+            self._finalize_markdown()
 
             self.console.print(f"\n[{self.theme.info}]→ {event.message}[/{self.theme.info}]")
             if event.data and "arguments" in event.data:
+                from rich.syntax import Syntax
+
                 args_str = json.dumps(event.data["arguments"], indent=2)
                 self.console.print(
                     Panel(
@@ -47,6 +46,8 @@ class CLIAgentEventHandler(AgentEventHandler):
                 output = event.data["output"]
                 # Try to format as JSON
                 try:
+                    from rich.syntax import Syntax
+
                     result_json = json.loads(output)
                     self.console.print(
                         Panel(
@@ -58,9 +59,7 @@ class CLIAgentEventHandler(AgentEventHandler):
                     self.console.print(Panel(output, expand=False))
         elif event.type == AgentEventType.ERROR:
             # Finalize any existing markdown buffer before error output
-            if self.markdown_buffer:
-                self.markdown_buffer.finalize()
-                self.markdown_buffer = None
+            self._finalize_markdown()
 
             if event.data and event.data.get("is_error", False):
                 self.console.print(
@@ -83,9 +82,7 @@ class CLIAgentEventHandler(AgentEventHandler):
             self.markdown_buffer.add_chunk(event.message)
         elif event.type == AgentEventType.RESPONSE_COMPLETE:
             # Finalize markdown buffer to render any remaining content
-            if self.markdown_buffer:
-                self.markdown_buffer.finalize()
-                self.markdown_buffer = None
+            self._finalize_markdown()
 
             # Don't print the response complete message since we've already rendered the content
             # self.console.print(
@@ -94,6 +91,20 @@ class CLIAgentEventHandler(AgentEventHandler):
         elif event.type == AgentEventType.FINAL_ANSWER_NEEDED:
             self.console.print(f"[{self.theme.warning}]{event.message}[/{self.theme.warning}]")
 
+    def finalize(self) -> None:
+        """Finish any streamed response still in progress.
+
+        An interrupted stream ends without RESPONSE_COMPLETE, so the caller must
+        close it before the handler is reused for another turn.
+        """
+        self._finalize_markdown()
+
+    def _finalize_markdown(self) -> None:
+        """Render and discard the current markdown buffer, if any."""
+        if self.markdown_buffer:
+            self.markdown_buffer.finalize()
+            self.markdown_buffer = None
+
 
 class MarkdownStreamBuffer:
     """Buffer for streaming markdown content with live display."""
@@ -101,40 +112,58 @@ class MarkdownStreamBuffer:
     def __init__(self, console, theme):
         self.console = console
         self.theme = theme
-        self.buffer = ""
+        self._chunks: list[str] = []  # joined lazily, see buffer
         self.live = None
         self.show_streaming = True  # Control whether to show streaming
         self.max_preview_lines = 4  # Show first 4 lines as preview
         self.max_preview_chars = 200  # Limit total preview characters
+        self._preview_title = f"[{theme.info}]Response Preview[/{theme.info}]"
+        self.refresh_per_second = 4
+        self._next_preview = 0.0  # monotonic time when the preview may be rebuilt
+
+    @property
+    def buffer(self) -> str:
+        """Response text received so far.
+
+        Chunks are only joined when the text is read (at most once per preview
+        refresh), instead of re-copying the whole response for every chunk.
+        """
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
 
     def add_chunk(self, chunk: str):
         """Add a new chunk to the buffer and optionally show streaming."""
-        self.buffer += chunk
+        self._chunks.append(chunk)
 
         if not self.show_streaming:
             return
 
-        # Create live display on first chunk
+        # Live only redraws refresh_per_second times, so coalesce preview rebuilds
+        # (which rescan the whole buffer) for chunks arriving within one frame
+        now = time.monotonic()
+        if self.live is not None and now < self._next_preview:
+            return
+        self._next_preview = now + 1 / self.refresh_per_second
+
+        panel = Panel(
+            self._get_preview_content(),
+            title=self._preview_title,
+            border_style=self.theme.dim,
+            expand=False,
+        )
+
+        # Create live display on first chunk, otherwise update the preview
         if self.live is None:
-            preview_content = self._get_preview_content()
-            panel = Panel(
-                preview_content,
-                title=f"[{self.theme.info}]Response Preview[/{self.theme.info}]",
-                border_style=self.theme.dim,
-                expand=False,
-            )
             # Use transient=True for the status panel
-            self.live = Live(panel, console=self.console, refresh_per_second=4, transient=True)
+            self.live = Live(
+                panel,
+                console=self.console,
+                refresh_per_second=self.refresh_per_second,
+                transient=True,
+            )
             self.live.start()
         else:
-            # Update preview content
-            preview_content = self._get_preview_content()
-            panel = Panel(
-                preview_content,
-                title=f"[{self.theme.info}]Response Preview[/{self.theme.info}]",
-                border_style=self.theme.dim,
-                expand=False,
-            )
             self.live.update(panel)
 
     def finalize(self):
@@ -145,6 +174,9 @@ class MarkdownStreamBuffer:
             self.live = None
 
         if self.buffer.strip():
+            # Deferred: rich.markdown pulls in markdown-it and pygments
+            from rich.markdown import Markdown
+
             try:
                 # Render the complete content as beautiful markdown
                 markdown = Markdown(self.buffer.strip())
@@ -5,6 +5,7 @@ different CLI entry points.
 """
 
 import os
+from functools import lru_cache
 
 from rich.text import Text
 
@@ -14,24 +15,31 @@ except ImportError:
     __version__ = "dev"
 
 
+@lru_cache(maxsize=4)
+def _build_welcome_banner(title_style: str, info_style: str, dim_style: str, cwd: str) -> Text:
+    """Parse the banner markup for a given set of styles and working directory."""
+    return Text.from_markup(
+        f"[{title_style}] ██████╗ ██████╗ ██████╗  █████╗ \n"
+        "██╔════╝██╔═══██╗██╔══██╗██╔══██╗\n"
+        "██║     ██║   ██║██║  ██║███████║\n"
+        "██║     ██║   ██║██║  ██║██╔══██║\n"
+        "╚██████╗╚██████╔╝██████╔╝██║  ██║\n"
+        f" ╚═════╝ ╚═════╝ ╚═════╝ ╚═╝  ╚═╝[/{title_style}]\n"
+        f"[{info_style}]✨ Your AI-powered coding companion[/{info_style}]\n"
+        f"[{dim_style}]v{__version__} • {cwd}[/{dim_style}]"
+    )
+
+
 def create_welcome_banner(theme) -> Text:
     """Create the welcome banner with ASCII art and version info.
 
+    The parsed banner is cached per theme styles and working directory, so
+    repeated calls skip markup parsing.
+
     Args:
         theme: Theme object containing console theme colors
 
     Returns:
         Text: Rich Text object with formatted banner
     """
-    banner_text = Text.from_markup(
-        f"[{theme.panel_title}] ██████╗ ██████╗ ██████╗  █████╗ \n"
-        "██╔════╝██╔═══██╗██╔══██╗██╔══██╗\n"
-        "██║     ██║   ██║██║  ██║███████║\n"
-        "██║     ██║   ██║██║  ██║██╔══██║\n"
-        "╚██████╗╚██████╔╝██████╔╝██║  ██║\n"
-        f" ╚═════╝ ╚═════╝ ╚═════╝ ╚═╝  ╚═╝[/{theme.panel_title}]\n"
-        f"[{theme.info}]✨ Your AI-powered coding companion[/{theme.info}]\n"
-        f"[{theme.dim}]v{__version__} • {os.getcwd()}[/{theme.dim}]"
-    )
-
-    return banner_text
+    return _build_welcome_banner(theme.panel_title, theme.info, theme.dim, os.getcwd())
@@ -1,13 +1,45 @@
 """Main CLI entry point with command groups."""
 
+import importlib
+
 import click
 
 from coda.__version__ import __version__
 
-from .web_command import web as web_command
 
+class LazyGroup(click.Group):
+    """Click group that imports subcommands only when they are resolved.
+
+    Subcommands are registered as ``"module:attribute"`` import strings, so
+    building the parser for the default chat path (or ``--version``) never
+    imports modules that belong to other subcommands.
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            return self._load_lazy(cmd_name)
+        return super().get_command(ctx, cmd_name)
 
-@click.group(invoke_without_command=True)
+    def _load_lazy(self, cmd_name: str) -> click.Command:
+        module_name, attr_name = self.lazy_subcommands[cmd_name].rsplit(":", 1)
+        command = getattr(importlib.import_module(module_name), attr_name)
+        if not isinstance(command, click.Command):
+            raise ValueError(f"Lazy subcommand '{cmd_name}' did not resolve to a click command")
+        return command
+
+
+@click.group(
+    cls=LazyGroup,
+    invoke_without_command=True,
+    lazy_subcommands={"web": "coda.apps.cli.web_command:web"},
+)
 @click.pass_context
 @click.version_option(version=__version__, prog_name="coda")
 def cli(ctx):
@@ -42,8 +74,5 @@ def chat(provider, model, debug, one_shot, quiet, mode, no_save, resume):
     main(provider, model, debug, one_shot, mode, no_save, resume, quiet)
 
 
-cli.add_command(web_command, name="web")
-
-
 if __name__ == "__main__":
     cli()
@@ -1,11 +1,14 @@
 """Enhanced tab completion system for Coda interactive CLI."""
 
 from abc import ABC
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from prompt_toolkit.completion import Completer, Completion, PathCompleter
 from prompt_toolkit.document import Document
 
+from .constants import MAX_MODELS_DISPLAY
+
 if TYPE_CHECKING:
     from prompt_toolkit.completion import CompleteEvent
 
@@ -27,9 +30,16 @@ class FuzzyMatcher:
         Returns:
             Tuple of (matches, score) where score is 0.0-1.0
         """
-        text = text.lower()
-        candidate = candidate.lower()
+        return FuzzyMatcher.match_lowered(text.lower(), candidate.lower())
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def match_lowered(text: str, candidate: str) -> tuple[bool, float]:
+        """Same as fuzzy_match, for callers that have already lowercased both strings.
 
+        Results are memoized, so retyping or backspacing through a query reuses the
+        scores computed for earlier keystrokes.
+        """
         # Exact match
         if text == candidate:
             return True, 1.0
@@ -38,20 +48,17 @@ class FuzzyMatcher:
         if candidate.startswith(text):
             return True, 0.9
 
-        # Fuzzy match - all characters in order
-        text_idx = 0
-        matches = 0
-        for char in candidate:
-            if text_idx < len(text) and char == text[text_idx]:
-                matches += 1
-                text_idx += 1
-
-        if text_idx == len(text):
-            # All characters matched
-            score = matches / len(candidate)
-            return True, score * 0.8  # Lower score for fuzzy matches
+        # Fuzzy match - all characters in order. Each character is located with
+        # str.find, so the scan over the candidate runs in C rather than per character.
+        pos = 0
+        for char in text:
+            pos = candidate.find(char, pos) + 1
+            if not pos:
+                return False, 0.0
 
-        return False, 0.0
+        # All characters matched
+        score = len(text) / len(candidate)
+        return True, score * 0.8  # Lower score for fuzzy matches
 
 
 class BaseCompleter(Completer, ABC):
@@ -60,11 +67,26 @@ class BaseCompleter(Completer, ABC):
     def __init__(self):
         self._cache = {}
         self._cache_timeout = 60  # seconds
+        self._theme_manager = None
 
     def clear_cache(self):
         """Clear the completion cache."""
         self._cache.clear()
 
+    @property
+    def prompt_theme(self):
+        """Prompt theme of the active theme.
+
+        The theme manager is looked up once and kept, so completing a keystroke
+        doesn't re-resolve the config service; the current theme is still read on
+        each access so theme switches take effect.
+        """
+        if self._theme_manager is None:
+            from coda.services.config import get_config_service
+
+            self._theme_manager = get_config_service().theme_manager
+        return self._theme_manager.current_theme.prompt
+
 
 class SlashCommandCompleter(BaseCompleter):
     """Enhanced completer for slash commands with fuzzy matching."""
@@ -72,6 +94,12 @@ class SlashCommandCompleter(BaseCompleter):
     def __init__(self, commands: dict[str, "SlashCommand"]):
         super().__init__()
         self.commands = commands
+        # Commands don't change after startup, so sort and format them once
+        self._command_rows = [
+            (cmd_name, f"/{cmd_name}", cmd.help_text) for cmd_name, cmd in sorted(commands.items())
+        ]
+        # Completions for empty input, keyed by the style they were built with
+        self._all_commands: tuple[str, list[Completion]] | None = None
 
     def get_completions(self, document: Document, complete_event: "CompleteEvent"):
         text = document.text_before_cursor
@@ -101,29 +129,30 @@ class SlashCommandCompleter(BaseCompleter):
 
     def _complete_all_commands(self):
         """Complete all available commands when no input given."""
-        from coda.services.config import get_config_service
-
-        config_service = get_config_service()
-        prompt_theme = config_service.theme_manager.current_theme.prompt
-
-        for cmd_name, cmd in sorted(self.commands.items()):
-            yield Completion(
-                f"/{cmd_name}",
-                start_position=0,
-                display=f"/{cmd_name}",
-                display_meta=cmd.help_text,
-                style=prompt_theme.info + " bold",
+        style = self.prompt_theme.info + " bold"
+        # The full list only depends on the theme, so build it once and reuse it
+        if self._all_commands is None or self._all_commands[0] != style:
+            self._all_commands = (
+                style,
+                [
+                    Completion(
+                        slash_name,
+                        start_position=0,
+                        display=slash_name,
+                        display_meta=help_text,
+                        style=style,
+                    )
+                    for _cmd_name, slash_name, help_text in self._command_rows
+                ],
             )
+        yield from self._all_commands[1]
 
     def _complete_subcommands(self, cmd_part: str, parts: list[str]):
         """Complete subcommands for the given command."""
         # Import here to avoid circular imports
-        from coda.services.config import get_config_service
-
         from .command_registry import CommandRegistry
 
-        config_service = get_config_service()
-        prompt_theme = config_service.theme_manager.current_theme.prompt
+        prompt_theme = self.prompt_theme
 
         cmd_def = CommandRegistry.get_command(cmd_part)
         if cmd_def and cmd_def.subcommands:
@@ -142,25 +171,22 @@ class SlashCommandCompleter(BaseCompleter):
 
     def _complete_command_names(self, cmd_part: str, text: str):
         """Complete command names with fuzzy matching."""
-        from coda.services.config import get_config_service
-
-        config_service = get_config_service()
-        prompt_theme = config_service.theme_manager.current_theme.prompt
+        prompt_theme = self.prompt_theme
 
         completions = []
 
         # Check main commands only (no aliases)
-        for cmd_name, cmd in self.commands.items():
+        for cmd_name, slash_name, help_text in self._command_rows:
             matches, score = FuzzyMatcher.fuzzy_match(cmd_part, cmd_name)
             if matches:
                 completions.append(
                     (
                         score,
                         Completion(
-                            "/" + cmd_name,
+                            slash_name,
                             start_position=-len(text),
-                            display=f"/{cmd_name}",
-                            display_meta=cmd.help_text,
+                            display=slash_name,
+                            display_meta=help_text,
                             style=(
                                 prompt_theme.info + " bold" if score >= 0.9 else prompt_theme.info
                             ),
@@ -168,8 +194,9 @@ class SlashCommandCompleter(BaseCompleter):
                     )
                 )
 
-        # Sort by score (highest first) and yield
-        for _score, completion in sorted(completions, key=lambda x: (-x[0], x[1].text)):
+        # Sort by score (highest first) and yield; rows are already in name order
+        # and the sort is stable, so equal scores stay alphabetical
+        for _score, completion in sorted(completions, key=lambda x: -x[0]):
             yield completion
 
 
@@ -181,6 +208,12 @@ class DynamicValueCompleter(BaseCompleter):
         self.get_provider = get_provider_func
         self.session_commands = session_commands
         self.get_themes = get_themes_func
+        # Model index: sorted (model_id, lowered) rows, rebuilt only when the ids change,
+        # plus the rows matching the last query so that typing more narrows from there
+        self._model_ids: tuple[str, ...] = ()
+        self._model_rows: list[tuple[str, str]] = []
+        self._model_query: str | None = None
+        self._model_matches: list[tuple[str, str]] = []
 
     def get_completions(self, document: Document, complete_event: "CompleteEvent"):
         text = document.text_before_cursor
@@ -247,13 +280,37 @@ class DynamicValueCompleter(BaseCompleter):
                 value_part = parts[2]
                 yield from self._complete_value(subcommand.completion_type, value_part)
 
+    def _match_models(self, model_ids: tuple[str, ...], value_part: str) -> list[tuple[str, float]]:
+        """Return (model_id, score) for every model matching value_part, in name order."""
+        if model_ids != self._model_ids:
+            self._model_ids = model_ids
+            self._model_rows = sorted((model_id, model_id.lower()) for model_id in model_ids)
+            self._model_query = None
+
+        query = value_part.lower()
+        # A subsequence of the longer query is also one of the shorter query, so the
+        # previous matches are the only candidates when the user keeps typing
+        if self._model_query is not None and query.startswith(self._model_query):
+            candidates = self._model_matches
+        else:
+            candidates = self._model_rows
+
+        matches = []
+        results = []
+        for row in candidates:
+            matched, score = FuzzyMatcher.match_lowered(query, row[1])
+            if matched:
+                matches.append(row)
+                results.append((row[0], score))
+
+        self._model_query = query
+        self._model_matches = matches
+        return results
+
     def _complete_value(self, completion_type: str, value_part: str):
         """Complete a value based on its type."""
         # Get prompt theme for styling
-        from coda.services.config import get_config_service
-
-        config_service = get_config_service()
-        prompt_theme = config_service.theme_manager.current_theme.prompt
+        prompt_theme = self.prompt_theme
 
         if completion_type == "model_name" and self.get_provider:
             provider = self.get_provider()
@@ -261,21 +318,21 @@ class DynamicValueCompleter(BaseCompleter):
                 try:
                     models = provider.list_models()
                     # Extract model IDs from Model objects
-                    model_ids = [m.id if hasattr(m, "id") else str(m) for m in models]
-                    for model_id in sorted(model_ids):
-                        matches, score = FuzzyMatcher.fuzzy_match(value_part, model_id)
-                        if matches:
-                            yield Completion(
-                                model_id,
-                                start_position=-len(value_part),
-                                display=model_id,
-                                display_meta="AI Model",
-                                style=(
-                                    prompt_theme.success + " bold"
-                                    if score >= 0.9
-                                    else prompt_theme.success
-                                ),
-                            )
+                    model_ids = tuple(m.id if hasattr(m, "id") else str(m) for m in models)
+                    matches = self._match_models(model_ids, value_part)
+                    # Only as many as the menu shows; typing narrows the rest
+                    for model_id, score in matches[:MAX_MODELS_DISPLAY]:
+                        yield Completion(
+                            model_id,
+                            start_position=-len(value_part),
+                            display=model_id,
+                            display_meta="AI Model",
+                            style=(
+                                prompt_theme.success + " bold"
+                                if score >= 0.9
+                                else prompt_theme.success
+                            ),
+                        )
                 except Exception:
                     pass
 
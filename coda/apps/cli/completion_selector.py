@@ -25,34 +25,56 @@ class OptionCompleter(Completer):
         """
         self.options = options
         self.prompt_theme = prompt_theme
+        # Parsed display per option; the options never change, so build them once
+        self._displays = [self._format_display(*option) for option in options]
+        # Lowercased "value\0description" per option, so filtering is one substring
+        # test; the separator keeps a match from spanning both fields
+        self._haystacks = [f"{value}\0{description}".lower() for value, description, _ in options]
+        # Last filter word and the option indices it matched, for incremental filtering
+        self._last_word = ""
+        self._last_matches: list[int] = list(range(len(options)))
+
+    @staticmethod
+    def _format_display(value: str, description: str, metadata: dict[str, Any] | None) -> HTML:
+        """Build the HTML display label for a single option."""
+        # For HTML display, we need to use HTML-safe color formatting
+        display = f"{value:<15} {description}"
+        if metadata:
+            # Add metadata, skipping tools metadata
+            meta_str = " ".join(f"[{k}: {v}]" for k, v in metadata.items() if k != "tools")
+            if meta_str:
+                display += f" {meta_str}"
+
+        return HTML(display)
 
     def get_completions(self, document, complete_event):
         """Get completions based on current input."""
         word = document.text_before_cursor.lower()
 
-        for value, description, metadata in self.options:
+        if not word:
+            matches = list(range(len(self.options)))
+        else:
+            # Typing more characters can only narrow the previous matches
+            if self._last_word and word.startswith(self._last_word):
+                candidates = self._last_matches
+            else:
+                candidates = range(len(self.options))
+
+            haystacks = self._haystacks
             # Match if search text is in value or description
-            if not word or word in value.lower() or word in description.lower():
-                # Format display with metadata if available
-                # For HTML display, we need to use HTML-safe color formatting
-                display = f"{value:<15} {description}"
-                if metadata:
-                    # Add metadata
-                    meta_items = []
-                    for k, v in metadata.items():
-                        if k != "tools":  # Skip tools metadata
-                            meta_items.append(f"{k}: {v}")
-
-                    if meta_items:
-                        meta_str = " ".join(f"[{item}]" for item in meta_items)
-                        display += f" {meta_str}"
-
-                yield Completion(
-                    value,
-                    start_position=-len(document.text_before_cursor),
-                    display=HTML(display),
-                    display_meta=description,
-                )
+            matches = [i for i in candidates if word in haystacks[i]]
+
+        self._last_word = word
+        self._last_matches = matches
+
+        for i in matches:
+            value, description, _ = self.options[i]
+            yield Completion(
+                value,
+                start_position=-len(document.text_before_cursor),
+                display=self._displays[i],
+                display_meta=description,
+            )
 
 
 class CompletionSelector:
@@ -125,6 +147,9 @@ class CompletionSelector:
         return PromptSession(
             completer=completer,
             complete_while_typing=True,
+            # Filter off the event loop; keystrokes typed while a pass is running
+            # are coalesced into a single follow-up pass
+            complete_in_thread=True,
             style=style,
             mouse_support=True,
             complete_style="MULTI_COLUMN",  # or 'COLUMN' for single column
@@ -29,18 +29,13 @@ class DeveloperMode:
     REFACTOR: str = "refactor"
     PLAN: str = "plan"
 
+    # All modes, built once
+    ALL: tuple[str, ...] = (GENERAL, CODE, DEBUG, EXPLAIN, REVIEW, REFACTOR, PLAN)
+
     @classmethod
     def all(cls) -> list[str]:
         """Get all available modes."""
-        return [
-            cls.GENERAL,
-            cls.CODE,
-            cls.DEBUG,
-            cls.EXPLAIN,
-            cls.REVIEW,
-            cls.REFACTOR,
-            cls.PLAN,
-        ]
+        return list(cls.ALL)
 
 
 # Export formats
@@ -52,15 +47,13 @@ class ExportFormat:
     TXT: str = "txt"
     HTML: str = "html"
 
+    # All formats, built once
+    ALL: tuple[str, ...] = (JSON, MARKDOWN, TXT, HTML)
+
     @classmethod
     def all(cls) -> list[str]:
         """Get all export formats."""
-        return [
-            cls.JSON,
-            cls.MARKDOWN,
-            cls.TXT,
-            cls.HTML,
-        ]
+        return list(cls.ALL)
 
 
 # File names
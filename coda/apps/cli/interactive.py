@@ -1,6 +1,5 @@
 """Interactive CLI module with rich features using prompt-toolkit."""
 
-import asyncio
 import sys
 from typing import TYPE_CHECKING
 
@@ -13,6 +12,9 @@ if TYPE_CHECKING:
 
 from .agent_chat import AgentChatHandler
 from .interactive_cli import DeveloperMode, InteractiveCLI
+from .shared import get_system_prompt
+from .shared.modes import MODES_BY_VALUE
+from .utils import run_async
 
 try:
     from coda.__version__ import __version__
@@ -26,6 +28,17 @@ config_service = get_config_service()
 console = config_service.theme_manager.get_console()
 theme = config_service.theme_manager.get_console_theme()
 
+# Spinner text shown while the agent works, by developer mode
+THINKING_MESSAGES = {
+    DeveloperMode.GENERAL: "Thinking",
+    DeveloperMode.CODE: "Generating code",
+    DeveloperMode.DEBUG: "Analyzing",
+    DeveloperMode.EXPLAIN: "Preparing explanation",
+    DeveloperMode.REVIEW: "Reviewing",
+    DeveloperMode.REFACTOR: "Analyzing code structure",
+    DeveloperMode.PLAN: "Planning",
+}
+
 
 async def _check_first_run(console: Console, auto_save_enabled: bool):
     """Check if this is the first run and show auto-save notification."""
@@ -115,13 +128,11 @@ async def _get_chat_models(provider_instance, console: Console):
     if not chat_models:
         chat_models = models
 
-    # Deduplicate models by ID
-    seen = set()
-    unique_models = []
+    # Deduplicate models by ID in a single pass, keeping the first occurrence
+    models_by_id = {}
     for m in chat_models:
-        if m.id not in seen:
-            seen.add(m.id)
-            unique_models.append(m)
+        models_by_id.setdefault(m.id, m)
+    unique_models = list(models_by_id.values())
 
     return unique_models
 
@@ -169,6 +180,10 @@ async def _setup_provider_and_models(
     if not provider:
         provider = config.default_provider
 
+    # Fail fast on unknown providers before copying config into a factory
+    if provider not in ProviderFactory.list_available():
+        _handle_provider_error(ValueError(f"Unknown provider: {provider}"), provider, debug)
+
     # Create provider using factory
     factory = ProviderFactory(config.to_dict())
 
@@ -206,13 +221,11 @@ async def _setup_provider_and_models(
 
         return provider_instance, unique_models, model
 
-    except ValueError as e:
-        _handle_provider_error(e, provider, debug, factory)
     except Exception as e:
         _handle_provider_error(e, provider, debug)
 
 
-def _handle_provider_error(e: Exception, provider: str, debug: bool, factory=None):
+def _handle_provider_error(e: Exception, provider: str, debug: bool):
     """Common error handler for provider setup errors."""
     import sys
     import traceback
@@ -228,8 +241,9 @@ def _handle_provider_error(e: Exception, provider: str, debug: bool, factory=Non
         )
     elif "Unknown provider" in str(e):
         console.print(f"\n[{theme.error}]Error:[/{theme.error}] Provider '{provider}' not found")
-        if factory:
-            console.print(f"\nAvailable providers: {', '.join(factory.list_available())}")
+        from coda.base.providers import ProviderFactory
+
+        console.print(f"\nAvailable providers: {', '.join(ProviderFactory.list_available())}")
     else:
         error_msg = str(e)
         if "OCI GenAI authorization failed" in error_msg:
@@ -238,7 +252,7 @@ def _handle_provider_error(e: Exception, provider: str, debug: bool, factory=Non
         else:
             console.print(f"\n[{theme.error}]Error:[/{theme.error}] {e}")
 
-    if debug:
+    if debug and e.__traceback__ is not None:
         traceback.print_exc()
 
     sys.exit(1)
@@ -278,7 +292,34 @@ def _save_agent_messages(cli, messages: list, provider_instance, interrupted: bo
         )
 
 
-async def _handle_chat_interaction(provider_instance, cli, messages, console: Console, config=None):
+def _messages_after_last_user(messages: list) -> list:
+    """Return the messages that follow the most recent user message."""
+    from coda.base.providers import Role
+
+    for index in range(len(messages) - 1, -1, -1):
+        if messages[index].role == Role.USER:
+            return messages[index + 1 :]
+    return []
+
+
+def _get_generation_params(config=None) -> tuple[float, int]:
+    """Resolve temperature and max_tokens from config once per session."""
+    if not config:
+        from coda.services.config import get_config_service
+
+        config = get_config_service()
+    return config.get("temperature", 0.7), config.get("max_tokens", 2000)
+
+
+async def _handle_chat_interaction(
+    provider_instance,
+    cli,
+    messages,
+    console: Console,
+    config=None,
+    generation_params: tuple[float, int] | None = None,
+    agent_handler: AgentChatHandler | None = None,
+):
     """Handle a single chat interaction including streaming response."""
     from coda.base.providers import Message, Role
 
@@ -350,22 +391,7 @@ async def _handle_chat_interaction(provider_instance, cli, messages, console: Co
     )
 
     # Choose thinking message based on mode
-    thinking_messages = {
-        DeveloperMode.GENERAL: "Thinking",
-        DeveloperMode.CODE: "Generating code",
-        DeveloperMode.DEBUG: "Analyzing",
-        DeveloperMode.EXPLAIN: "Preparing explanation",
-        DeveloperMode.REVIEW: "Reviewing",
-        DeveloperMode.REFACTOR: "Analyzing code structure",
-        DeveloperMode.PLAN: "Planning",
-    }
-    thinking_msg = thinking_messages.get(cli.current_mode, "Thinking")
-
-    # Prepare messages with system prompt
-    chat_messages = []
-    if system_prompt:
-        chat_messages.append(Message(role=Role.SYSTEM, content=system_prompt))
-    chat_messages.extend(messages)
+    thinking_msg = THINKING_MESSAGES.get(cli.current_mode, "Thinking")
 
     # Clear interrupt event before starting
     cli.reset_interrupt()
@@ -377,19 +403,11 @@ async def _handle_chat_interaction(provider_instance, cli, messages, console: Co
     interrupted = False
 
     try:
-        # Get generation parameters from config or defaults
-        if not config:
-            from coda.services.config import get_config_service
-
-            config = get_config_service()
-        temperature = config.get("temperature", 0.7)
-        max_tokens = config.get("max_tokens", 2000)
+        # Use session-level generation parameters, falling back to config lookup
+        temperature, max_tokens = generation_params or _get_generation_params(config)
 
         # Always use agent handler for consistency (it handles both tool and non-tool cases)
-        agent_handler = AgentChatHandler(provider_instance, cli, console)
-
-        # Get system prompt from mode
-        system_prompt_for_agent = _get_system_prompt_for_mode(cli.current_mode)
+        agent_handler = agent_handler or AgentChatHandler(provider_instance, cli, console)
 
         # Start thinking animation and run agent
         status = console.status(
@@ -399,11 +417,11 @@ async def _handle_chat_interaction(provider_instance, cli, messages, console: Co
         try:
             # Run agent with status for animation
             full_response, updated_messages = await agent_handler.chat_with_agent(
-                messages.copy(),  # Pass a copy to avoid modifying original
+                messages,  # The handler only reads the history and returns a new list
                 cli.current_model,
                 temperature,
                 max_tokens,
-                system_prompt_for_agent,
+                system_prompt,
                 status=status,  # Pass status for thinking animation
             )
             # Check if response was interrupted
@@ -417,12 +435,14 @@ async def _handle_chat_interaction(provider_instance, cli, messages, console: Co
         # Agent already handled streaming display, just ensure proper spacing
         console.print()
 
-        # Update messages to match what happened
-        messages.clear()
-        messages.extend(updated_messages)
+        # Update messages in place to match what happened (may be the same list on error)
+        messages[:] = updated_messages
 
-        # Save all messages from the agent interaction to session
-        _save_agent_messages(cli, updated_messages[1:], provider_instance, interrupted)
+        # Save only the messages the agent added after this turn's user message; the
+        # history and the user message itself are already in the session
+        _save_agent_messages(
+            cli, _messages_after_last_user(updated_messages), provider_instance, interrupted
+        )
     except (ConnectionError, TimeoutError) as e:
         console.print(f"\n\n[{theme.error}]Network error during streaming: {e}[/{theme.error}]")
         return True  # Continue loop
@@ -511,9 +531,21 @@ async def run_interactive_session(
         else:
             messages = []
 
+        # Resolve generation parameters once rather than on every turn
+        generation_params = _get_generation_params(config)
+
+        # One handler for the session keeps its agent (and processed tools) across turns
+        agent_handler = AgentChatHandler(provider_instance, cli, console)
+
         while True:
             continue_chat = await _handle_chat_interaction(
-                provider_instance, cli, messages, console, config
+                provider_instance,
+                cli,
+                messages,
+                console,
+                config,
+                generation_params,
+                agent_handler,
             )
             if not continue_chat:
                 break
@@ -531,8 +563,6 @@ async def run_interactive_session(
 
 def _get_system_prompt_for_mode(mode: DeveloperMode) -> str:
     """Get system prompt based on developer mode."""
-    from coda.apps.cli.shared import get_system_prompt
-
     return get_system_prompt(mode)
 
 
@@ -558,7 +588,7 @@ async def run_one_shot(
 
     try:
         # Convert mode string to enum
-        developer_mode = DeveloperMode(mode.lower())
+        developer_mode = MODES_BY_VALUE[mode.lower()]
 
         # Get system prompt for mode
         system_prompt = _get_system_prompt_for_mode(developer_mode)
@@ -573,16 +603,15 @@ async def run_one_shot(
         console.print(f"\n[{theme.user_message} bold]You:[/{theme.user_message} bold] {prompt}")
 
         # Always use agent handler for consistency
-        from .agent_chat import AgentChatHandler
-
         agent_handler = AgentChatHandler(provider_instance, None, console)
 
         # Get response from agent
+        temperature, max_tokens = _get_generation_params(config)
         response_content, _ = await agent_handler.chat_with_agent(
             [Message(role=Role.USER, content=prompt)],
             model,
-            temperature=config.get("temperature", 0.7),
-            max_tokens=config.get("max_tokens", 2000),
+            temperature=temperature,
+            max_tokens=max_tokens,
             system_prompt=system_prompt,
         )
 
@@ -659,10 +688,10 @@ def interactive_main(
 
     if one_shot:
         # Handle one-shot mode
-        asyncio.run(run_one_shot(provider, model, one_shot, mode, debug, no_save))
+        run_async(run_one_shot(provider, model, one_shot, mode, debug, no_save))
     else:
         # Run interactive session
-        asyncio.run(run_interactive_session(provider, model, debug, no_save, resume))
+        run_async(run_interactive_session(provider, model, debug, no_save, resume))
 
 
 if __name__ == "__main__":
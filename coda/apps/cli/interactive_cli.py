@@ -1,6 +1,7 @@
 """Interactive CLI with prompt-toolkit for enhanced user experience."""
 
 import asyncio
+import signal
 from collections.abc import Callable
 from pathlib import Path
 from threading import Event
@@ -28,6 +29,8 @@ class SlashCommand:
     ):
         self.name = name
         self.handler = handler
+        # Resolved once so dispatch doesn't inspect the handler on every call
+        self.is_async = asyncio.iscoroutinefunction(handler)
         self.help_text = help_text
         self.aliases = aliases or []
         self._autocomplete_options = None
@@ -46,6 +49,20 @@ class SlashCommand:
 class InteractiveCLI(CommandHandler):
     """Interactive CLI with advanced prompt features using prompt-toolkit."""
 
+    # Map Rich color names to prompt-toolkit compatible colors
+    PROMPT_COLOR_MAP = {
+        "bright_cyan": "ansicyan",
+        "bright_green": "ansigreen",
+        "bright_yellow": "ansiyellow",
+        "bright_blue": "ansiblue",
+        "bright_red": "ansired",
+        "blue": "ansiblue",
+        "green": "ansigreen",
+        "yellow": "ansiyellow",
+        "red": "ansired",
+        "cyan": "ansicyan",
+    }
+
     def __init__(self, console: Console = None) -> None:
         # Get config service once
         from coda.services.config import get_config_service
@@ -62,9 +79,11 @@ class InteractiveCLI(CommandHandler):
         self.theme = config_service.theme_manager.get_console_theme()
 
         self.session = None
+        self._prompt_cache: dict[str, HTML] = {}  # Parsed prompts keyed by color
         self.config = None  # Will be set by interactive.py
         self.provider = None  # Will be set by interactive.py
         self.commands = self._init_commands()
+        self._command_lookup = self._build_command_lookup(self.commands)
         self.style = self._create_style()
 
         # For interrupt handling
@@ -160,6 +179,17 @@ class InteractiveCLI(CommandHandler):
 
         return commands
 
+    @staticmethod
+    def _build_command_lookup(commands: dict[str, SlashCommand]) -> dict[str, SlashCommand]:
+        """Map command names and aliases to commands for O(1) dispatch."""
+        lookup = {}
+        for cmd in commands.values():
+            for alias in cmd.aliases:
+                lookup.setdefault(alias, cmd)
+        # Command names take precedence over aliases
+        lookup.update(commands)
+        return lookup
+
     def _create_style(self) -> Style:
         """Create custom style for the prompt."""
         # Get theme-based style and extend it with additional styles
@@ -327,20 +357,6 @@ class InteractiveCLI(CommandHandler):
 
     def _get_prompt(self) -> HTML:
         """Generate the prompt with mode indicator."""
-        # Map Rich color names to prompt-toolkit compatible colors
-        color_map = {
-            "bright_cyan": "ansicyan",
-            "bright_green": "ansigreen",
-            "bright_yellow": "ansiyellow",
-            "bright_blue": "ansiblue",
-            "bright_red": "ansired",
-            "blue": "ansiblue",
-            "green": "ansigreen",
-            "yellow": "ansiyellow",
-            "red": "ansired",
-            "cyan": "ansicyan",
-        }
-
         # Get theme color for current mode
         theme_color = {
             DeveloperMode.GENERAL: self.theme.info,
@@ -353,10 +369,14 @@ class InteractiveCLI(CommandHandler):
         }.get(self.current_mode, self.theme.info)
 
         # Convert Rich color to prompt-toolkit color
-        mode_color = color_map.get(theme_color, "ansiwhite")
+        mode_color = self.PROMPT_COLOR_MAP.get(theme_color, "ansiwhite")
 
-        # Use prompt theme styling for the arrow
-        return HTML(f"<{mode_color}>❯</{mode_color}> ")
+        # Parse the prompt markup once per color instead of on every turn
+        prompt = self._prompt_cache.get(mode_color)
+        if prompt is None:
+            prompt = HTML(f"<{mode_color}>❯</{mode_color}> ")
+            self._prompt_cache[mode_color] = prompt
+        return prompt
 
     async def get_input(self, multiline: bool = False) -> str:
         """Get input from user with rich features."""
@@ -399,25 +419,18 @@ class InteractiveCLI(CommandHandler):
 
     async def process_slash_command(self, command_text: str) -> bool:
         """Process a slash command. Returns True if handled, False otherwise."""
-        parts = command_text[1:].split(maxsplit=1)
-        if not parts:
+        cmd_name, _, args = command_text[1:].lstrip().partition(" ")
+        if not cmd_name:
             return False
 
-        cmd_name = parts[0]
-        args = parts[1] if len(parts) > 1 else ""
+        args = args.lstrip()
 
-        # Check direct command match
-        if cmd_name in self.commands:
-            handler = self.commands[cmd_name].handler
-            await self._execute_command_handler(handler, args)
+        # Single lookup covers both command names and aliases
+        cmd = self._command_lookup.get(cmd_name)
+        if cmd is not None:
+            await self._execute_command(cmd, args)
             return True
 
-        # Check aliases
-        for _name, cmd in self.commands.items():
-            if cmd_name in cmd.aliases:
-                await self._execute_command_handler(cmd.handler, args)
-                return True
-
         self.console.print(f"[{self.theme.error}]Unknown command: /{cmd_name}[/{self.theme.error}]")
         self.console.print("Type /help for available commands")
         return True
@@ -581,12 +594,12 @@ class InteractiveCLI(CommandHandler):
             f"[{self.theme.bold}]Description:[/{self.theme.bold}] {theme_manager.current_theme.description}"
         )
 
-    async def _execute_command_handler(self, handler: Callable, args: str) -> None:
-        """Execute command handler with proper async handling."""
-        if asyncio.iscoroutinefunction(handler):
-            await handler(args)
+    async def _execute_command(self, cmd: SlashCommand, args: str) -> None:
+        """Execute a command's handler with proper async handling."""
+        if cmd.is_async:
+            await cmd.handler(args)
         else:
-            handler(args)
+            cmd.handler(args)
 
     async def _cmd_session(self, args: str):
         """Manage sessions."""
@@ -1264,20 +1277,17 @@ class InteractiveCLI(CommandHandler):
         self.escape_count = 0
         self.ctrl_c_count = 0
 
+    def _handle_interrupt_signal(self, signum, frame):
+        """Handle Ctrl+C during AI response by flagging the interrupt."""
+        self.interrupt_event.set()
+
     def start_interrupt_listener(self):
         """Start signal handler for Ctrl+C during AI response."""
-        import signal
-
-        def interrupt_handler(signum, frame):
-            """Handle Ctrl+C during AI response."""
-            self.interrupt_event.set()
-
-        # Store the old handler
-        self.old_sigint_handler = signal.signal(signal.SIGINT, interrupt_handler)
+        # Store the old handler; the flag-setting handler is a bound method,
+        # so no new closure is created on every turn
+        self.old_sigint_handler = signal.signal(signal.SIGINT, self._handle_interrupt_signal)
 
     def stop_interrupt_listener(self):
         """Restore original signal handler."""
-        import signal
-
         if hasattr(self, "old_sigint_handler"):
             signal.signal(signal.SIGINT, self.old_sigint_handler)
@@ -1,14 +1,11 @@
+import sys
+
 try:
     from coda.__version__ import __version__
 except ImportError:
     # Fallback for when package structure isn't available
     __version__ = "dev"
 
-from coda.services.config import get_config_service
-
-# Import error handler
-from .error_handler import CLIErrorHandler
-
 # Console and theme will be initialized after loading config
 console = None
 theme = None
@@ -28,11 +25,13 @@ def main(
 
     # Validate quiet flag
     if quiet and not one_shot:
-        import sys
-
         print("Error: --quiet flag can only be used with --one-shot", file=sys.stderr)
         sys.exit(1)
 
+    from coda.services.config import get_config_service
+
+    from . import CLIErrorHandler
+
     # Load configuration
     config = get_config_service()
 
@@ -54,23 +53,24 @@ def main(
 
     # Always use interactive mode
     try:
-        import asyncio
+        from .interactive import run_interactive_session, run_one_shot
+        from .utils import run_async
 
-        from rich.panel import Panel
+        # Show welcome banner (suppressed in quiet mode, skipped for piped one-shot output)
+        if not theme.quiet and not (one_shot and not sys.stdout.isatty()):
+            from rich.panel import Panel
 
-        from .banner import create_welcome_banner
-        from .interactive import run_interactive_session, run_one_shot
+            from .banner import create_welcome_banner
 
-        # Show welcome banner (will be suppressed if quiet mode is enabled)
-        welcome_text = create_welcome_banner(theme)
-        console.print(Panel(welcome_text, title="Welcome", border_style=theme.panel_border))
+            welcome_text = create_welcome_banner(theme)
+            console.print(Panel(welcome_text, title="Welcome", border_style=theme.panel_border))
 
         if one_shot:
             # Handle one-shot mode
-            asyncio.run(run_one_shot(provider, model, one_shot, mode, debug, no_save))
+            run_async(run_one_shot(provider, model, one_shot, mode, debug, no_save))
         else:
             # Run interactive session
-            asyncio.run(run_interactive_session(provider, model, debug, no_save, resume))
+            run_async(run_interactive_session(provider, model, debug, no_save, resume))
     except ImportError as e:
         # If prompt-toolkit is not available, show error (will be suppressed if quiet)
         console.print(
@@ -86,7 +86,5 @@ def main(
             error_handler.handle_general_error(e)
         else:
             # In quiet mode, just print the error to stderr
-            import sys
-
             sys.stderr.write(f"Error: {str(e)}\n")
         sys.exit(1)
@@ -16,21 +16,31 @@ class ProviderManager:
         self.console = console
         self.factory = ProviderFactory(config.to_dict())
         self.theme = config.theme_manager.get_console_theme()
+        self._provider_cache: dict[str, BaseProvider] = {}
 
     def initialize_provider(self, provider_name: str | None = None) -> BaseProvider:
-        """Initialize and connect to a provider."""
+        """Initialize and connect to a provider.
+
+        Provider instances are cached by name, so switching back to a provider
+        reuses its client and connection pool.
+        """
         # Use default provider if not specified
         provider_name = provider_name or self.config.default_provider
 
         self.console.print(
             f"\n[{self.theme.success}]Provider:[/{self.theme.success}] {provider_name}"
         )
+
+        if provider_name in self._provider_cache:
+            return self._provider_cache[provider_name]
+
         self.console.print(
             f"[{self.theme.warning}]Initializing {provider_name}...[/{self.theme.warning}]"
         )
 
         # Create provider instance
         provider_instance = self.factory.create(provider_name)
+        self._provider_cache[provider_name] = provider_instance
         self.console.print(
             f"[{self.theme.success}]✓ Connected to {provider_name}[/{self.theme.success}]"
         )
@@ -61,13 +71,11 @@ class ProviderManager:
         if not chat_models:
             chat_models = models
 
-        # Deduplicate models by ID
-        seen = set()
-        unique_models = []
+        # Deduplicate models by ID in a single pass, keeping the first occurrence
+        models_by_id = {}
         for m in chat_models:
-            if m.id not in seen:
-                seen.add(m.id)
-                unique_models.append(m)
+            models_by_id.setdefault(m.id, m)
+        unique_models = list(models_by_id.values())
 
         return models, unique_models
 
@@ -96,13 +104,12 @@ class ProviderManager:
             return selected
 
         # Use interactive model selector
-        import asyncio
-
         from .completion_selector import CompletionModelSelector
+        from .utils import run_async
 
         selector = CompletionModelSelector(unique_models, self.console)
         # Run the async selector in a new event loop
-        return asyncio.run(selector.select_interactive())
+        return run_async(selector.select_interactive())
 
     def get_provider_error_message(
         self, error: Exception, provider_name: str
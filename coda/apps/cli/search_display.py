@@ -1,16 +1,93 @@
 """Enhanced search result display with rich formatting."""
 
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from rich.console import Console
+from pygments.lexer import Lexer
+from pygments.lexers import get_lexer_by_name
+from pygments.util import ClassNotFound
+from rich.console import Console, Group, RenderableType
 from rich.highlighter import RegexHighlighter
 from rich.panel import Panel
 from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.style import Style
 from rich.syntax import Syntax
 from rich.table import Table
 from rich.text import Text
 
-from coda.base.search import SearchResult
+if TYPE_CHECKING:
+    # Only needed for annotations; importing coda.base.search pulls in the
+    # whole vector-search stack (numpy, FAISS, embedding provider SDKs)
+    from coda.base.search import SearchResult
+
+# Simple heuristics for code detection
+_CODE_SAMPLE_SIZE = 4096
+_CODE_CHARS = frozenset("{}()[]=&|")
+_CODE_INDICATORS = (
+    "def ",
+    "class ",
+    "function ",
+    "const ",
+    "let ",
+    "var ",
+    "import ",
+    "from ",
+    "return ",
+    "if ",
+    "for ",
+    "while ",
+    "{",
+    "}",
+    "()",
+    "[]",
+    "=>",
+    "==",
+    "!=",
+    "&&",
+    "||",
+)
+
+# Metadata keys that are internal or already shown in the result header
+_EXCLUDED_METADATA_KEYS = frozenset(
+    {
+        "source",
+        "language",
+        "type",
+        "file_path",
+        "file_type",
+        "start_line",
+        "end_line",
+        "chunk_index",
+        "chunk_type",
+        "dimension",
+    }
+)
+# Chunk types too common to be worth showing
+_PLAIN_CHUNK_TYPES = frozenset({"text", "module"})
+
+
+@lru_cache(maxsize=32)
+def _get_lexer(lang: str) -> Lexer | None:
+    """Get a shared Pygments lexer for a language, or None if it is unknown."""
+    try:
+        return get_lexer_by_name(lang, stripnl=False, ensurenl=True, tabsize=4)
+    except ClassNotFound:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _compile_term_pattern(term: str) -> re.Pattern[str]:
+    """Compile the case-insensitive whole-word pattern for a search term."""
+    return re.compile(rf"\b{re.escape(term)}\b", re.IGNORECASE)
+
+
+@lru_cache(maxsize=128)
+def _compile_terms_pattern(terms: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile a single case-insensitive whole-word alternation for all search terms."""
+    return re.compile(rf"\b(?:{'|'.join(map(re.escape, terms))})\b", re.IGNORECASE)
 
 
 class SearchHighlighter(RegexHighlighter):
@@ -19,13 +96,19 @@ class SearchHighlighter(RegexHighlighter):
     def __init__(self, query_terms: list[str]):
         super().__init__()
         self.query_terms = query_terms
-        # Create a new instance-specific highlights list
-        self.highlights = []
-        # Build regex patterns for each term
-        for term in query_terms:
-            # Case-insensitive matching
-            pattern = f"(?i)\\b{term}\\b"
-            self.highlights.append(pattern)
+        # Create a new instance-specific highlights list of compiled patterns,
+        # shared across highlighters so repeated searches don't recompile them
+        self.highlights = [_compile_term_pattern(term) for term in query_terms]
+        # Combined pattern so result text is scanned once for all terms; longest
+        # terms first so overlapping alternatives prefer the longer match
+        self.terms = tuple(sorted(set(query_terms), key=lambda t: (-len(t), t)))
+        self.pattern = _compile_terms_pattern(self.terms) if self.terms else None
+        self._lowered_terms = tuple(term.lower() for term in self.terms)
+
+    def has_hits(self, text: str) -> bool:
+        """Cheaply check whether any term can match, before running the regex."""
+        text = text.lower()
+        return any(term in text for term in self._lowered_terms)
 
 
 class SearchResultDisplay:
@@ -39,9 +122,16 @@ class SearchResultDisplay:
         config = get_config_service()
         self.theme = config.theme_manager.get_console_theme()
 
+        # Per-result styles, parsed once rather than for every result rendered
+        self._code_border_style = Style.parse(self.theme.success)
+        self._text_border_style = Style.parse(self.theme.info)
+        self._highlight_style = Style.parse(f"{self.theme.warning} bold")
+        self._metadata_style = Style.parse(self.theme.dim)
+        self._metadata_key_style = Style.parse(self.theme.info)
+
     def display_results(
         self,
-        results: list[SearchResult],
+        results: list["SearchResult"],
         query: str,
         max_preview_length: int = 300,
         show_metadata: bool = True,
@@ -63,33 +153,47 @@ class SearchResultDisplay:
         highlighter = SearchHighlighter(query_terms)
 
         # Create header
-        self.console.print()
-        self.console.print(
+        renderables: list[RenderableType] = [
+            Text(),
             Panel(
                 f"[{self.theme.bold} {self.theme.info}]Found {len(results)} results for:[/{self.theme.bold} {self.theme.info}] [{self.theme.bold}]{query}[/{self.theme.bold}]",
                 expand=False,
                 border_style=self.theme.panel_border,
-            )
-        )
-        self.console.print()
+            ),
+            Text(),
+        ]
+
+        # Resolve the working directory once for relativising source paths
+        try:
+            cwd = Path.cwd()
+        except OSError:
+            cwd = None
 
-        # Display each result
+        # Render each result
         for i, result in enumerate(results, 1):
-            self._display_single_result(result, i, highlighter, max_preview_length, show_metadata)
+            renderables.extend(
+                self._render_single_result(
+                    result, i, highlighter, max_preview_length, show_metadata, cwd
+                )
+            )
 
             # Add separator between results (except after last)
             if i < len(results):
-                self.console.print()
+                renderables.append(Text())
 
-    def _display_single_result(
+        # Print everything in a single render pass
+        self.console.print(Group(*renderables))
+
+    def _render_single_result(
         self,
-        result: SearchResult,
+        result: "SearchResult",
         index: int,
         highlighter: SearchHighlighter,
         max_preview_length: int,
         show_metadata: bool,
-    ) -> None:
-        """Display a single search result with formatting."""
+        cwd: Path | None = None,
+    ) -> list[RenderableType]:
+        """Render a single search result with formatting."""
         # Create result header with score
         score_color = self._get_score_color(result.score)
         header = f"[{self.theme.bold}]#{index}[/{self.theme.bold}]  [{self.theme.dim}]Score:[/{self.theme.dim}] [{score_color}]{result.score:.3f}[/{score_color}]"
@@ -104,12 +208,11 @@ class SearchResultDisplay:
 
             if source:
                 # Make path relative if possible
-                try:
-                    source_path = Path(source)
-                    if source_path.is_absolute():
-                        source = source_path.relative_to(Path.cwd())
-                except (ValueError, OSError):
-                    pass
+                if cwd and os.path.isabs(source):
+                    try:
+                        source = Path(source).relative_to(cwd)
+                    except ValueError:
+                        pass
 
                 # Add line numbers if chunk information is available
                 if "start_line" in result.metadata and "end_line" in result.metadata:
@@ -119,14 +222,6 @@ class SearchResultDisplay:
 
                 header += f"  [{self.theme.dim}]Source:[/{self.theme.dim}] [{self.theme.info}]{source}[/{self.theme.info}]"
 
-        # Prepare content preview
-        content = self._prepare_content_preview(result.text, max_preview_length)
-
-        # Apply highlighting
-        highlighted_content = Text(content)
-        for term in highlighter.query_terms:
-            highlighted_content.highlight_words(term, style=self.theme.warning + " bold")
-
         # Check if content looks like code
         is_code = self._detect_code(result.text, result.metadata)
 
@@ -162,7 +257,7 @@ class SearchResultDisplay:
                 # Use the full text for syntax highlighting, not the truncated preview
                 syntax = Syntax(
                     result.text[:max_preview_length],
-                    lang,
+                    _get_lexer(lang) or lang,
                     theme=self.theme.code_theme,
                     line_numbers=True,
                     word_wrap=True,
@@ -171,35 +266,53 @@ class SearchResultDisplay:
                     syntax,
                     title=header,
                     title_align="left",
-                    border_style=self.theme.success,
+                    border_style=self._code_border_style,
                     padding=(0, 1),
                 )
-                self.console.print(code_panel)
-
-                # Display metadata if requested and available
-                if show_metadata and result.metadata:
-                    self._display_metadata(result.metadata)
-                return
+                return self._with_metadata(code_panel, result.metadata, show_metadata)
 
         # If not code or no language detected
+        # Prepare content preview
+        content = self._prepare_content_preview(result.text, max_preview_length)
+
+        # Apply highlighting
+        highlighted_content = Text(content)
+        if highlighter.pattern and highlighter.has_hits(content):
+            highlighted_content.highlight_regex(highlighter.pattern, style=self._highlight_style)
+
         # Display as regular text with highlighting
         content_panel = Panel(
             highlighted_content,
             title=header,
             title_align="left",
-            border_style=self.theme.info,
+            border_style=self._text_border_style,
             padding=(0, 1),
         )
-        self.console.print(content_panel)
-
-        # Display metadata if requested and available
-        if show_metadata and result.metadata:
-            self._display_metadata(result.metadata)
+        return self._with_metadata(content_panel, result.metadata, show_metadata)
+
+    def _with_metadata(
+        self, panel: Panel, metadata: dict | None, show_metadata: bool
+    ) -> list[RenderableType]:
+        """Pair a result panel with its metadata table, if requested and available."""
+        renderables: list[RenderableType] = [panel]
+        if show_metadata and metadata:
+            table = self._build_metadata_table(metadata)
+            if table is not None:
+                renderables.append(table)
+        return renderables
 
     def _prepare_content_preview(self, text: str, max_length: int) -> str:
         """Prepare content for preview with smart truncation."""
-        # Remove excessive whitespace
-        text = " ".join(text.split())
+        # Remove excessive whitespace. Normalising a prefix of the text gives a
+        # prefix of the normalised text, so only normalise as much as the preview
+        # needs instead of splitting the whole (possibly very long) result.
+        size = max_length * 2 + 64
+        while True:
+            normalized = " ".join(text[:size].split())
+            if len(normalized) > max_length or size >= len(text):
+                break
+            size *= 2
+        text = normalized
 
         if len(text) <= max_length:
             return text
@@ -207,20 +320,17 @@ class SearchResultDisplay:
         # Try to find a good breaking point
         truncated = text[:max_length]
 
-        # Look for sentence end
-        last_period = truncated.rfind(".")
-        last_question = truncated.rfind("?")
-        last_exclaim = truncated.rfind("!")
-
-        # Find the best breaking point
-        best_break = max(last_period, last_question, last_exclaim)
+        # Look for sentence end; only breaks in the last 30% are good enough,
+        # so don't scan the rest of the text
+        sentence_start = int(max_length * 0.7) + 1
+        best_break = max(truncated.rfind(end, sentence_start) for end in ".?!")
 
-        if best_break > max_length * 0.7:  # If we found a good sentence break
+        if best_break != -1:  # If we found a good sentence break
             return truncated[: best_break + 1]
 
         # Otherwise break at word boundary
-        last_space = truncated.rfind(" ")
-        if last_space > max_length * 0.8:
+        last_space = truncated.rfind(" ", int(max_length * 0.8) + 1)
+        if last_space != -1:
             return truncated[:last_space] + "..."
 
         return truncated + "..."
@@ -233,32 +343,15 @@ class SearchResultDisplay:
             if "language" in metadata:
                 return True
 
-        # Simple heuristics for code detection
-        code_indicators = [
-            "def ",
-            "class ",
-            "function ",
-            "const ",
-            "let ",
-            "var ",
-            "import ",
-            "from ",
-            "return ",
-            "if ",
-            "for ",
-            "while ",
-            "{",
-            "}",
-            "()",
-            "[]",
-            "=>",
-            "==",
-            "!=",
-            "&&",
-            "||",
-        ]
+        # The start of the text is enough to tell; long chunks need not be scanned whole
+        sample = text[:_CODE_SAMPLE_SIZE]
+
+        # Quick rejection: code nearly always contains some of these characters,
+        # and checking for them is far cheaper than the substring scans below
+        if _CODE_CHARS.isdisjoint(sample):
+            return False
 
-        return any(indicator in text for indicator in code_indicators)
+        return any(indicator in sample for indicator in _CODE_INDICATORS)
 
     def _get_score_color(self, score: float) -> str:
         """Get color based on similarity score."""
@@ -271,30 +364,20 @@ class SearchResultDisplay:
         else:
             return "red"
 
-    def _display_metadata(self, metadata: dict) -> None:
-        """Display metadata in a formatted table."""
+    def _build_metadata_table(self, metadata: dict) -> Table | None:
+        """Build a formatted table of metadata, or None if there is nothing to show."""
         # Filter out internal metadata and already displayed fields
-        exclude_keys = {
-            "source",
-            "language",
-            "type",
-            "file_path",
-            "file_type",
-            "start_line",
-            "end_line",
-            "chunk_index",
-            "dimension",
-        }
-
         display_metadata = {
-            k: v for k, v in metadata.items() if not k.startswith("_") and k not in exclude_keys
+            k: v
+            for k, v in metadata.items()
+            if k not in _EXCLUDED_METADATA_KEYS and not k.startswith("_")
         }
 
         # Add special formatting for certain fields
         formatted_items = []
 
         # Show chunk type if interesting
-        if "chunk_type" in metadata and metadata["chunk_type"] not in ["text", "module"]:
+        if "chunk_type" in metadata and metadata["chunk_type"] not in _PLAIN_CHUNK_TYPES:
             formatted_items.append(("Chunk Type", metadata["chunk_type"]))
 
         # Show other metadata
@@ -303,16 +386,16 @@ class SearchResultDisplay:
             formatted_items.append((formatted_key, str(value)))
 
         if not formatted_items:
-            return
+            return None
 
-        table = Table(show_header=False, box=None, padding=(0, 2), style=self.theme.dim)
-        table.add_column("Key", style=self.theme.info)
+        table = Table(show_header=False, box=None, padding=(0, 2), style=self._metadata_style)
+        table.add_column("Key", style=self._metadata_key_style)
         table.add_column("Value")
 
         for key, value in formatted_items:
             table.add_row(f"  {key}:", value)
 
-        self.console.print(table)
+        return table
 
 
 class IndexingProgress:
@@ -8,6 +8,7 @@ from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
 from rich.table import Table
 
+from coda.base.providers.base import Message, Role
 from coda.base.session import Session, SessionManager
 from coda.base.session.constants import (
     AUTO_DATE_FORMAT as AUTO_SESSION_DATE_FORMAT,
@@ -31,6 +32,14 @@ from coda.base.session.constants import (
     LIMIT_SEARCH as SESSION_SEARCH_LIMIT,
 )
 
+# Stored role names to CLI message roles; tool messages fall back to user
+ROLE_BY_NAME = {
+    "user": Role.USER,
+    "assistant": Role.ASSISTANT,
+    "system": Role.SYSTEM,
+    "tool": Role.USER,
+}
+
 
 class SessionCommands:
     """Handles session-related slash commands."""
@@ -164,17 +173,7 @@ class SessionCommands:
             )
 
             # Save all messages
-            for msg in self.current_messages:
-                self.manager.add_message(
-                    session_id=session.id,
-                    role=msg["role"],
-                    content=msg["content"],
-                    metadata=msg.get("metadata", {}),
-                    model=msg.get("metadata", {}).get("model"),
-                    provider=msg.get("metadata", {}).get("provider"),
-                    token_usage=msg.get("metadata", {}).get("token_usage"),
-                    cost=msg.get("metadata", {}).get("cost"),
-                )
+            self._save_current_messages(session.id)
 
             self.current_session_id = session.id
             return f"Session saved: {name} (ID: {session.id[:8]}...)"
@@ -802,6 +801,24 @@ Most used tool: [{self.theme.info}]{summary["most_used"] or "N/A"}[/{self.theme.
         )
         return None
 
+    def _save_current_messages(self, session_id: str) -> None:
+        """Save the whole current conversation to a session in one transaction."""
+        messages = []
+        for msg in self.current_messages:
+            metadata = msg.get("metadata", {})
+            messages.append(
+                {
+                    "role": msg["role"],
+                    "content": msg["content"],
+                    "metadata": metadata,
+                    "model": metadata.get("model"),
+                    "provider": metadata.get("provider"),
+                    "token_usage": metadata.get("token_usage"),
+                    "cost": metadata.get("cost"),
+                }
+            )
+        self.manager.add_messages(session_id, messages)
+
     def add_message(self, role: str, content: str, metadata: dict[str, Any] | None = None):
         """Add a message to the current conversation.
 
@@ -846,17 +863,7 @@ Most used tool: [{self.theme.info}]{summary["most_used"] or "N/A"}[/{self.theme.
                 self.current_session_id = session.id
 
                 # Save all existing messages to the new session
-                for existing_msg in self.current_messages:
-                    self.manager.add_message(
-                        session_id=session.id,
-                        role=existing_msg["role"],
-                        content=existing_msg["content"],
-                        metadata=existing_msg.get("metadata", {}),
-                        model=existing_msg.get("metadata", {}).get("model"),
-                        provider=existing_msg.get("metadata", {}).get("provider"),
-                        token_usage=existing_msg.get("metadata", {}).get("token_usage"),
-                        cost=existing_msg.get("metadata", {}).get("cost"),
-                    )
+                self._save_current_messages(session.id)
 
                 # Notify user about auto-save (subtly)
                 if not self.theme.quiet:
@@ -914,20 +921,10 @@ Most used tool: [{self.theme.info}]{summary["most_used"] or "N/A"}[/{self.theme.
         if not hasattr(self, "_messages_loaded") or not self._messages_loaded:
             return []
 
-        from coda.base.providers import Message, Role
-
-        cli_messages = []
-        for msg in self.current_messages:
-            # Convert role string to Role enum
-            role_map = {
-                "user": Role.USER,
-                "assistant": Role.ASSISTANT,
-                "system": Role.SYSTEM,
-                "tool": Role.USER,  # Fallback for tool messages
-            }
-            role = role_map.get(msg["role"], Role.USER)
-
-            cli_messages.append(Message(role=role, content=msg["content"]))
+        cli_messages = [
+            Message(role=ROLE_BY_NAME.get(msg["role"], Role.USER), content=msg["content"])
+            for msg in self.current_messages
+        ]
 
         # Reset the flag after providing messages
         self._messages_loaded = False
@@ -2,13 +2,15 @@
 
 from abc import ABC, abstractmethod
 from enum import Enum
+from itertools import islice
 from typing import Any
 
 from rich.console import Console
 
 from coda.base.providers import ProviderFactory
 
-from .modes import DeveloperMode, get_mode_description
+from ..constants import MAX_MODELS_BASIC_DISPLAY
+from .modes import MODE_LIST, MODES_BY_VALUE, VALID_MODES, DeveloperMode, get_mode_description
 
 
 class CommandResult(Enum):
@@ -71,14 +73,14 @@ class CommandHandler(ABC):
             self.console.print(
                 f"[{self.console_theme.bold}]Available modes:[/{self.console_theme.bold}]"
             )
-            for mode in DeveloperMode:
+            for mode, description in MODE_LIST:
                 if mode == self.current_mode:
                     self.console.print(
-                        f"  [{self.console_theme.success}]▶ {mode.value}[/{self.console_theme.success}] - {get_mode_description(mode)}"
+                        f"  [{self.console_theme.success}]▶ {mode.value}[/{self.console_theme.success}] - {description}"
                     )
                 else:
                     self.console.print(
-                        f"  [{self.console_theme.info}]{mode.value}[/{self.console_theme.info}] - {get_mode_description(mode)}"
+                        f"  [{self.console_theme.info}]{mode.value}[/{self.console_theme.info}] - {description}"
                     )
 
             self.console.print(
@@ -86,23 +88,23 @@ class CommandHandler(ABC):
             )
             return CommandResult.HANDLED
 
-        try:
-            self.current_mode = DeveloperMode(mode_str.lower())
-            self.console.print(
-                f"[{self.console_theme.success}]Switched to {self.current_mode.value} mode[/{self.console_theme.success}]"
-            )
-            self.console.print(
-                f"[{self.console_theme.dim}]{get_mode_description(self.current_mode)}[/{self.console_theme.dim}]"
-            )
-            return CommandResult.HANDLED
-        except ValueError:
+        mode = MODES_BY_VALUE.get(mode_str.lower())
+        if mode is None:
             self.console.print(
                 f"[{self.console_theme.error}]Invalid mode: {mode_str}[/{self.console_theme.error}]"
             )
-            valid_modes = ", ".join(m.value for m in DeveloperMode)
-            self.console.print(f"Valid modes: {valid_modes}")
+            self.console.print(f"Valid modes: {VALID_MODES}")
             return CommandResult.HANDLED
 
+        self.current_mode = mode
+        self.console.print(
+            f"[{self.console_theme.success}]Switched to {self.current_mode.value} mode[/{self.console_theme.success}]"
+        )
+        self.console.print(
+            f"[{self.console_theme.dim}]{get_mode_description(self.current_mode)}[/{self.console_theme.dim}]"
+        )
+        return CommandResult.HANDLED
+
     def switch_model(self, model_name: str) -> CommandResult:
         """Switch to a different model."""
         if not self.available_models:
@@ -112,34 +114,30 @@ class CommandHandler(ABC):
             return CommandResult.HANDLED
 
         if not model_name:
-            # Show current model and available models
-            self.console.print(
-                f"\n[{self.console_theme.warning}]Current model:[/{self.console_theme.warning}] {self.current_model}"
-            )
-            self.console.print(
-                f"\n[{self.console_theme.bold}]Available models:[/{self.console_theme.bold}]"
-            )
-
-            # Show top 10 models
-            for i, model in enumerate(self.available_models[:10]):
-                self.console.print(
-                    f"  {i + 1}. [{self.console_theme.info}]{model.id}[/{self.console_theme.info}]"
-                )
-
-            if len(self.available_models) > 10:
-                self.console.print(
-                    f"  [{self.console_theme.dim}]... and {len(self.available_models) - 10} more[/{self.console_theme.dim}]"
-                )
-
-            self.console.print(
-                f"\n[{self.console_theme.dim}]Usage: /model <model_name>[/{self.console_theme.dim}]"
-            )
+            # Show current model and available models, rendered in a single print
+            theme = self.console_theme
+            lines = [
+                f"\n[{theme.warning}]Current model:[/{theme.warning}] {self.current_model}",
+                f"\n[{theme.bold}]Available models:[/{theme.bold}]",
+            ]
+
+            # Show top models
+            for i, model in enumerate(islice(self.available_models, MAX_MODELS_BASIC_DISPLAY), 1):
+                lines.append(f"  {i}. [{theme.info}]{model.id}[/{theme.info}]")
+
+            remaining = len(self.available_models) - MAX_MODELS_BASIC_DISPLAY
+            if remaining > 0:
+                lines.append(f"  [{theme.dim}]... and {remaining} more[/{theme.dim}]")
+
+            lines.append(f"\n[{theme.dim}]Usage: /model <model_name>[/{theme.dim}]")
+            self.console.print("\n".join(lines))
             return CommandResult.HANDLED
 
         # Try to switch to the specified model
-        matching_models = [m for m in self.available_models if model_name.lower() in m.id.lower()]
-        if matching_models:
-            selected_model = matching_models[0]
+        # First match wins, so stop scanning as soon as one is found
+        needle = model_name.lower()
+        selected_model = next((m for m in self.available_models if needle in m.id.lower()), None)
+        if selected_model:
             self.current_model = selected_model.id
             self.console.print(
                 f"[{self.console_theme.success}]Switched to model: {self.current_model}[/{self.console_theme.success}]"
@@ -1,10 +1,27 @@
 """Shared help content and formatting for CLI modes."""
 
+from collections.abc import Callable
+
 from rich.console import Console
 
+from coda.base.theme import ConsoleTheme
 from coda.services.config import get_config_service
 
-from .modes import DeveloperMode, get_mode_description
+from .modes import MODE_LIST
+
+# Built help markup keyed by (section, id(theme)). The command registry and modes
+# are static, so the text only changes with the theme; holding the theme in the
+# value keeps its id from being reused while the entry exists.
+_help_cache: dict[tuple[str, int], tuple[ConsoleTheme, str]] = {}
+
+
+def _get_cached_help(section: str, theme: ConsoleTheme, build: Callable[[], str]) -> str:
+    """Return the help markup for a section, building it once per theme."""
+    key = (section, id(theme))
+    cached = _help_cache.get(key)
+    if cached is None:
+        cached = _help_cache[key] = (theme, build())
+    return cached[1]
 
 
 def print_command_help(console: Console, mode: str = ""):
@@ -16,7 +33,9 @@ def print_command_help(console: Console, mode: str = ""):
     try:
         from ..command_registry import CommandRegistry
 
-        help_text = CommandRegistry.get_command_help(mode=mode)
+        help_text = _get_cached_help(
+            f"commands:{mode}", theme, lambda: CommandRegistry.get_command_help(mode=mode)
+        )
         console.print(help_text)
         return
     except ImportError:
@@ -59,10 +78,13 @@ def print_developer_modes(console: Console):
     config_service = get_config_service()
     theme = config_service.theme_manager.get_console_theme()
 
-    console.print(f"[{theme.bold}]Developer Modes:[/{theme.bold}]")
-    for mode in DeveloperMode:
-        desc = get_mode_description(mode)
-        console.print(f"  [{theme.command}]{mode.value}[/{theme.command}] - {desc}")
+    def build() -> str:
+        lines = [f"[{theme.bold}]Developer Modes:[/{theme.bold}]"]
+        for mode, desc in MODE_LIST:
+            lines.append(f"  [{theme.command}]{mode.value}[/{theme.command}] - {desc}")
+        return "\n".join(lines)
+
+    console.print(_get_cached_help("modes", theme, build))
     console.print()
 
 
@@ -71,31 +93,23 @@ def print_interactive_keyboard_shortcuts(console: Console):
     config_service = get_config_service()
     theme = config_service.theme_manager.get_console_theme()
 
-    console.print(
-        f"[{theme.bold}]Keyboard Shortcuts:[/{theme.bold}] [{theme.dim}](Interactive mode features)[/{theme.dim}]"
-    )
-    console.print(
-        f"  [{theme.command}]Ctrl+C[/{theme.command}] - Clear input line / Interrupt AI response"
-    )
-    console.print(f"  [{theme.command}]Ctrl+D[/{theme.command}] - Exit the application")
-    console.print(
-        f"  [{theme.command}]Ctrl+R[/{theme.command}] - Reverse search through command history"
-    )
-    console.print(
-        f"  [{theme.command}]Tab[/{theme.command}] - Auto-complete commands and file paths"
-    )
-    console.print(f"  [{theme.command}]↑/↓[/{theme.command}] - Navigate command history")
-    console.print(f"  [{theme.command}]Ctrl+A/E[/{theme.command}] - Jump to beginning/end of line")
-    console.print(
-        f"  [{theme.command}]Ctrl+K[/{theme.command}] - Delete from cursor to end of line"
-    )
-    console.print(
-        f"  [{theme.command}]Ctrl+U[/{theme.command}] - Delete from cursor to beginning of line"
-    )
-    console.print(f"  [{theme.command}]Ctrl+W[/{theme.command}] - Delete word before cursor")
-    console.print(
-        rf"  [{theme.command}]\\[/{theme.command}] at line end - Continue input on next line"
-    )
+    def build() -> str:
+        lines = [
+            f"[{theme.bold}]Keyboard Shortcuts:[/{theme.bold}] [{theme.dim}](Interactive mode features)[/{theme.dim}]",
+            f"  [{theme.command}]Ctrl+C[/{theme.command}] - Clear input line / Interrupt AI response",
+            f"  [{theme.command}]Ctrl+D[/{theme.command}] - Exit the application",
+            f"  [{theme.command}]Ctrl+R[/{theme.command}] - Reverse search through command history",
+            f"  [{theme.command}]Tab[/{theme.command}] - Auto-complete commands and file paths",
+            f"  [{theme.command}]↑/↓[/{theme.command}] - Navigate command history",
+            f"  [{theme.command}]Ctrl+A/E[/{theme.command}] - Jump to beginning/end of line",
+            f"  [{theme.command}]Ctrl+K[/{theme.command}] - Delete from cursor to end of line",
+            f"  [{theme.command}]Ctrl+U[/{theme.command}] - Delete from cursor to beginning of line",
+            f"  [{theme.command}]Ctrl+W[/{theme.command}] - Delete word before cursor",
+            rf"  [{theme.command}]\\[/{theme.command}] at line end - Continue input on next line",
+        ]
+        return "\n".join(lines)
+
+    console.print(_get_cached_help("shortcuts", theme, build))
     console.print()
 
 
@@ -104,20 +118,17 @@ def print_interactive_only_commands(console: Console):
     config_service = get_config_service()
     theme = config_service.theme_manager.get_console_theme()
 
-    console.print(
-        f"[{theme.bold}]Session:[/{theme.bold}] [{theme.dim}](Interactive mode only)[/{theme.dim}]"
-    )
-    console.print(
-        f"  [{theme.command}]/session[/{theme.command}] (/s) - Save/load/manage conversations"
-    )
-    console.print(
-        f"  [{theme.command}]/export[/{theme.command}] (/e) - Export conversation to file"
-    )
-    console.print()
-
-    console.print(
-        f"[{theme.bold}]Advanced:[/{theme.bold}] [{theme.dim}](Interactive mode only)[/{theme.dim}]"
-    )
-    console.print(f"  [{theme.command}]/tools[/{theme.command}] (/t) - Manage MCP tools")
-    console.print(f"  [{theme.command}]/theme[/{theme.command}] - Change UI theme")
+    def build() -> str:
+        lines = [
+            f"[{theme.bold}]Session:[/{theme.bold}] [{theme.dim}](Interactive mode only)[/{theme.dim}]",
+            f"  [{theme.command}]/session[/{theme.command}] (/s) - Save/load/manage conversations",
+            f"  [{theme.command}]/export[/{theme.command}] (/e) - Export conversation to file",
+            "",
+            f"[{theme.bold}]Advanced:[/{theme.bold}] [{theme.dim}](Interactive mode only)[/{theme.dim}]",
+            f"  [{theme.command}]/tools[/{theme.command}] (/t) - Manage MCP tools",
+            f"  [{theme.command}]/theme[/{theme.command}] - Change UI theme",
+        ]
+        return "\n".join(lines)
+
+    console.print(_get_cached_help("interactive", theme, build))
     console.print()
@@ -25,6 +25,12 @@ MODE_DESCRIPTIONS = {
     DeveloperMode.PLAN: "Architecture planning and system design",
 }
 
+# (mode, description) pairs in declaration order; modes never change at runtime
+MODE_LIST = tuple((mode, MODE_DESCRIPTIONS[mode]) for mode in DeveloperMode)
+VALID_MODES = ", ".join(mode.value for mode in DeveloperMode)
+# Lookup for validating user input without raising on unknown values
+MODES_BY_VALUE = {mode.value: mode for mode in DeveloperMode}
+
 SYSTEM_PROMPTS = {
     DeveloperMode.GENERAL: "You are a helpful AI assistant. Provide clear, accurate, and useful responses to any questions or requests.",
     DeveloperMode.CODE: "You are a helpful coding assistant. Focus on writing clean, efficient, and well-documented code following best practices.",
@@ -11,6 +11,8 @@ from rich.syntax import Syntax
 from coda.base.providers.base import Message, Role, Tool
 from coda.services.tools.executor import ToolExecutor
 
+from .utils import StreamWriter
+
 
 class ToolChatHandler:
     """Handles AI chat with tool calling capabilities."""
@@ -228,8 +230,9 @@ class ToolChatHandler:
         max_tokens: int,
     ) -> str:
         """Fallback streaming chat without tools."""
-        full_response = ""
+        response_parts = []
         first_chunk = True
+        writer = StreamWriter(self.console)
 
         try:
             stream = self.provider.chat_stream(
@@ -239,6 +242,10 @@ class ToolChatHandler:
                 max_tokens=max_tokens,
             )
 
+            # Bind per-chunk callables to locals for the hot loop
+            write = writer.write
+            append_part = response_parts.append
+            is_interrupted = self.cli.interrupt_event.is_set
             for chunk in stream:
                 if first_chunk:
                     self.console.print(
@@ -247,25 +254,30 @@ class ToolChatHandler:
                     first_chunk = False
 
                 # Check for interrupt
-                if self.cli.interrupt_event.is_set():
+                if is_interrupted():
+                    writer.flush()
                     self.console.print(
                         f"\n\n[{self.theme.warning}]Response interrupted by user[/{self.theme.warning}]"
                     )
                     break
 
-                self.console.print(chunk.content, end="")
-                full_response += chunk.content
+                content = chunk.content
+                write(content)
+                append_part(content)
+
+            writer.flush()
 
             # Add newline after streaming
-            if full_response:
+            if any(response_parts):
                 self.console.print()
 
         except Exception as e:
+            writer.flush()
             self.console.print(
                 f"\n[{self.theme.error}]Error during streaming: {str(e)}[/{self.theme.error}]"
             )
 
-        return full_response
+        return "".join(response_parts)
 
     def _print_response(self, content: str):
         """Print AI response with formatting."""
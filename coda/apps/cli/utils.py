@@ -2,6 +2,26 @@
 
 import asyncio
 import time
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on a new event loop.
+
+    Uses uvloop's faster event loop when it is installed (the ``speedups`` extra),
+    falling back to the default asyncio loop otherwise.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coro)
 
 
 async def simple_thinking_animation(
@@ -19,25 +39,32 @@ async def simple_thinking_animation(
 
     start_time = time.time()
 
-    # Build the status message with theming
+    # Build the status markup once; only the elapsed time changes between frames
     if theme_info and theme_bold:
-        base_message = f"[{theme_info} {theme_bold}]{message}[/{theme_info} {theme_bold}]"
+        open_tag = f"[{theme_info} {theme_bold}]"
+        close_tag = f"[/{theme_info} {theme_bold}]"
     else:
-        base_message = message
+        open_tag = close_tag = ""
+    base_message = f"{open_tag}{message}{close_tag}"
+    status_prefix = f"{open_tag}{message}... "
+    status_suffix = f"s{close_tag}"
 
     try:
         # Use console.status() for the spinner
         with console.status(base_message, spinner=spinner_style) as status:
-            while not task.done():
-                elapsed = time.time() - start_time
+            # Status.update forces a refresh, so skip it when the text is unchanged
+            last_text = base_message
 
-                # Update status text with elapsed time
-                if theme_info and theme_bold:
-                    status_text = f"[{theme_info} {theme_bold}]{message}... {elapsed:.1f}s[/{theme_info} {theme_bold}]"
-                else:
-                    status_text = f"{message}... {elapsed:.1f}s"
+            def update(elapsed: float) -> None:
+                nonlocal last_text
+                text = f"{status_prefix}{elapsed:.1f}{status_suffix}"
+                if text != last_text:
+                    status.update(text)
+                    last_text = text
 
-                status.update(status_text)
+            while not task.done():
+                # Update status text with elapsed time
+                update(time.time() - start_time)
                 await asyncio.sleep(0.1)
 
             # Ensure minimum display time
@@ -45,24 +72,51 @@ async def simple_thinking_animation(
             if final_elapsed < min_display_time:
                 remaining = min_display_time - final_elapsed
                 while remaining > 0:
-                    if theme_info and theme_bold:
-                        status_text = f"[{theme_info} {theme_bold}]{message}... {final_elapsed:.1f}s[/{theme_info} {theme_bold}]"
-                    else:
-                        status_text = f"{message}... {final_elapsed:.1f}s"
-
-                    status.update(status_text)
+                    update(final_elapsed)
                     await asyncio.sleep(0.1)
                     remaining -= 0.1
                     final_elapsed = time.time() - start_time
 
         # After status clears, show completion time on same line
         final_time = time.time() - start_time
-        if theme_info and theme_bold:
-            console.print(
-                f"\r[{theme_info} {theme_bold}]⏱️  Completed in {final_time:.1f}s[/{theme_info} {theme_bold}]"
-            )
-        else:
-            console.print(f"\r⏱️  Completed in {final_time:.1f}s")
+        console.print(f"\r{open_tag}⏱️  Completed in {final_time:.1f}s{close_tag}")
 
     except Exception:
         raise
+
+
+class StreamWriter:
+    """Batch streamed response chunks into fewer console writes.
+
+    Model output is raw text, so chunks bypass Rich markup and style handling
+    and are written straight to the console's file once enough text has
+    accumulated or the flush interval has elapsed.
+    """
+
+    def __init__(self, console, max_chars: int = 64, flush_interval: float = 0.05):
+        self.console = console
+        self.max_chars = max_chars
+        self.flush_interval = flush_interval
+        self._parts: list[str] = []
+        self._size = 0
+        self._last_flush = time.monotonic()
+
+    def write(self, text: str) -> None:
+        """Buffer text and flush if the size or time threshold is reached."""
+        self._parts.append(text)
+        self._size += len(text)
+        if (
+            self._size >= self.max_chars
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write any buffered text to the console."""
+        if self._parts and not self.console.quiet:
+            file = self.console.file
+            file.write("".join(self._parts))
+            file.flush()
+        self._parts.clear()
+        self._size = 0
+        self._last_flush = time.monotonic()
@@ -9,11 +9,6 @@ from rich.panel import Panel
 
 from coda.services.config import get_config_service
 
-# Get themed console
-config_service = get_config_service()
-console = config_service.theme_manager.get_console()
-theme = config_service.theme_manager.get_console_theme()
-
 
 @click.command()
 @click.option("--port", "-p", default=8501, help="Port to run the web server on")
@@ -22,12 +17,17 @@ theme = config_service.theme_manager.get_console_theme()
 @click.option("--debug", is_flag=True, help="Run in debug mode")
 def web(port: int, host: str, browser: bool, debug: bool):
     """Launch the Coda Assistant web interface."""
+    # Load config only when the command runs, so `coda --help` never parses it
     try:
-        get_config_service()  # Validate config loads successfully
+        config_service = get_config_service()  # Validate config loads successfully
     except Exception as e:
-        console.print(f"[{theme.error}]Error loading configuration: {e}[/{theme.error}]")
+        click.echo(f"Error loading configuration: {e}", err=True)
         sys.exit(1)
 
+    # Get themed console
+    console = config_service.theme_manager.get_console()
+    theme = config_service.theme_manager.get_console_theme()
+
     console.print(
         Panel(
             f"[{theme.success}]Starting Coda Web UI on http://{host}:{port}[/{theme.success}]\n"
@@ -20,14 +20,19 @@ class StreamlitAgentEventHandler(AgentEventHandler):
         self.response_chunks = []
         self.current_status = None
         self.current_tool_name = None
+        # Single placeholder reused for every "Thinking..." notice
+        self._thinking_placeholder = None
 
     def handle_event(self, event: AgentEvent) -> None:
         """Handle agent event with appropriate Streamlit rendering."""
         try:
             if event.type == AgentEventType.THINKING:
                 if self.status_container:
-                    with self.status_container:
-                        st.info("🤔 Thinking...")
+                    # Update one element in place instead of stacking a new notice per turn
+                    if self._thinking_placeholder is None:
+                        with self.status_container:
+                            self._thinking_placeholder = st.empty()
+                    self._thinking_placeholder.info("🤔 Thinking...")
 
             elif event.type == AgentEventType.TOOL_EXECUTION_START:
                 if self.status_container:
@@ -19,6 +19,9 @@ try:
 except ImportError:
     DIAGRAM_RENDERER_AVAILABLE = False
 
+# Messages rendered on each rerun; older ones are only rendered on request
+MAX_RENDERED_MESSAGES = 50
+
 
 def render_chat_interface(provider: str, model: str):
     """Render the main chat interface."""
@@ -27,7 +30,16 @@ def render_chat_interface(provider: str, model: str):
     chat_container = st.container()
 
     with chat_container:
-        for message in messages:
+        # Streamlit re-renders the whole transcript on every interaction, so keep
+        # long conversations to the most recent messages unless asked otherwise
+        visible = messages
+        hidden = len(messages) - MAX_RENDERED_MESSAGES
+        if hidden > 0 and not st.toggle(
+            f"Show {hidden} earlier messages", key="show_earlier_messages"
+        ):
+            visible = messages[hidden:]
+
+        for message in visible:
             with st.chat_message(message["role"]):
                 # Always use render_message_with_code to handle both diagrams and regular code
                 render_message_with_code(message["content"])
@@ -6,17 +6,65 @@ It has zero external dependencies and uses only Python standard library.
 
 import json
 import os
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
+from stat import S_ISREG
 from typing import TYPE_CHECKING, Any, TypeVar
 
 from .models import ConfigFormat, ConfigPath, ConfigSource, LayeredConfig
 
+# TOML reader is resolved once at import rather than on every parse
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+# Optional writers/parsers are only imported when used; find_spec checks availability
+# without running the import machinery (or raising) for processes that never need them
+_HAS_TOMLI_W = find_spec("tomli_w") is not None
+_HAS_YAML = find_spec("yaml") is not None
+
 if TYPE_CHECKING:
     from .models import MCPConfig
 
 # Type variable for generic return types
 T = TypeVar("T")
 
+# Parsed package default.toml per app name (None if the package has none). Package
+# files don't change while the process runs, so later managers reuse the first parse.
+# The dicts are shared as layers and must not be mutated.
+_package_defaults: dict[str, dict[str, Any] | None] = {}
+
+
+@lru_cache(maxsize=32)
+def _user_dir(xdg_home: str | None, home: str | None, default: str, app_name: str) -> Path:
+    """Resolve an XDG user directory for an app.
+
+    The environment values are part of the cache key, so a changed ``XDG_*_HOME``
+    or ``HOME`` resolves afresh while repeated lookups reuse the same ``Path``.
+    """
+    if xdg_home:
+        return Path(xdg_home) / app_name
+    base = Path(home) if home else Path.home()
+    return base.joinpath(*default.split("/"), app_name)
+
+
+# Parsed config files by absolute path, tagged with the (mtime, size, format) they
+# were parsed at, so managers created later skip re-parsing unchanged files.
+_parsed_files: dict[Path, tuple[tuple[int, int, ConfigFormat], dict[str, Any]]] = {}
+
+
+def _stat_or_none(path: Path) -> os.stat_result | None:
+    """Stat a path, returning None if it does not exist or cannot be accessed."""
+    try:
+        return path.stat()
+    except (OSError, ValueError):
+        return None
+
 
 class ConfigManager:
     """Manages configuration from multiple sources with layered priority."""
@@ -60,6 +108,16 @@ class ConfigManager:
 
     def _load_package_defaults(self) -> None:
         """Load default.toml from the package if it exists."""
+        if self.app_name not in _package_defaults:
+            _package_defaults[self.app_name] = self._find_package_defaults()
+
+        defaults = _package_defaults[self.app_name]
+        if defaults is not None:
+            # Merging copies nested dicts, so managers can share the parsed layer
+            self.config.add_layer(defaults, ConfigSource.DEFAULT)
+
+    def _find_package_defaults(self) -> dict[str, Any] | None:
+        """Locate and parse the package default.toml, or return None if there is none."""
         try:
             import importlib.resources
 
@@ -77,9 +135,7 @@ class ConfigManager:
                         files = importlib.resources.files(location)
                         if files and (files / "default.toml").is_file():
                             default_content = (files / "default.toml").read_text()
-                            default_config = self._parse_toml(default_content)
-                            self.config.add_layer(default_config, ConfigSource.DEFAULT)
-                            return  # Found it, stop looking
+                            return self._parse_toml(default_content)  # Found it, stop looking
                     except Exception:
                         continue
             else:
@@ -98,15 +154,15 @@ class ConfigManager:
                             default_content = pkg_resources.resource_string(
                                 package, resource
                             ).decode("utf-8")
-                            default_config = self._parse_toml(default_content)
-                            self.config.add_layer(default_config, ConfigSource.DEFAULT)
-                            return  # Found it, stop looking
+                            return self._parse_toml(default_content)  # Found it, stop looking
                     except Exception:
                         continue
         except Exception:
             # If loading package defaults fails, continue
             pass
 
+        return None
+
     def _load_default_configs(self) -> None:
         """Load configuration from default locations."""
         # Define default config locations
@@ -132,31 +188,38 @@ class ConfigManager:
             )
             default_paths.append(json_path)
 
-        # Load each config file
+        # Load each config file, statting each candidate path only once
         for config_path in default_paths:
-            if config_path.is_readable():
-                self._load_config_file(config_path)
+            file_stat = _stat_or_none(config_path.path)
+            if file_stat is not None and S_ISREG(file_stat.st_mode):
+                self._load_config_file(config_path, file_stat)
+
+    def _load_config_file(
+        self, config_path: ConfigPath, file_stat: os.stat_result | None = None
+    ) -> None:
+        """Load a configuration file.
 
-    def _load_config_file(self, config_path: ConfigPath) -> None:
-        """Load a configuration file."""
-        if not config_path.exists():
+        Args:
+            config_path: Configuration file to load
+            file_stat: Result of statting the path, if the caller already has it
+        """
+        path = config_path.path.absolute()
+        if file_stat is None:
+            file_stat = _stat_or_none(path)
+        if file_stat is None:
             if config_path.required:
                 raise FileNotFoundError(f"Required config file not found: {config_path.path}")
             return
 
         try:
-            content = config_path.path.read_text()
-
-            if config_path.format == ConfigFormat.JSON:
-                data = json.loads(content)
-            elif config_path.format == ConfigFormat.TOML:
-                data = self._parse_toml(content)
-            elif config_path.format == ConfigFormat.YAML:
-                data = self._parse_yaml(content)
-            elif config_path.format == ConfigFormat.INI:
-                data = self._parse_ini(content)
+            signature = (file_stat.st_mtime_ns, file_stat.st_size, config_path.format)
+
+            cached = _parsed_files.get(path)
+            if cached is not None and cached[0] == signature:
+                data = cached[1]
             else:
-                raise ValueError(f"Unsupported format: {config_path.format}")
+                data = self._parse_content(path.read_text(), config_path.format)
+                _parsed_files[path] = (signature, data)
 
             self.config.add_layer(data, ConfigSource.FILE)
         except Exception:
@@ -165,23 +228,23 @@ class ConfigManager:
             # Silently ignore optional config files that fail to load
             pass
 
+    def _parse_content(self, content: str, format: ConfigFormat) -> dict[str, Any]:
+        """Parse configuration file content in the given format."""
+        if format == ConfigFormat.JSON:
+            return json.loads(content)
+        elif format == ConfigFormat.TOML:
+            return self._parse_toml(content)
+        elif format == ConfigFormat.YAML:
+            return self._parse_yaml(content)
+        elif format == ConfigFormat.INI:
+            return self._parse_ini(content)
+        else:
+            raise ValueError(f"Unsupported format: {format}")
+
     def _parse_toml(self, content: str) -> dict[str, Any]:
         """Parse TOML content (basic implementation)."""
-        # Try to use tomllib if available (Python 3.11+)
-        try:
-            import tomllib
-
+        if tomllib is not None:
             return tomllib.loads(content)
-        except ImportError:
-            pass
-
-        # Try tomli as fallback
-        try:
-            import tomli
-
-            return tomli.loads(content)
-        except ImportError:
-            pass
 
         # Basic fallback parser for simple TOML
         result = {}
@@ -230,12 +293,11 @@ class ConfigManager:
 
     def _parse_yaml(self, content: str) -> dict[str, Any]:
         """Parse YAML content."""
-        try:
-            import yaml
+        if not _HAS_YAML:
+            raise ImportError("PyYAML is required for YAML config files")
+        import yaml
 
-            return yaml.safe_load(content)
-        except ImportError:
-            raise ImportError("PyYAML is required for YAML config files") from None
+        return yaml.safe_load(content)
 
     def _parse_ini(self, content: str) -> dict[str, Any]:
         """Parse INI content."""
@@ -407,13 +469,10 @@ class ConfigManager:
         Returns:
             Path to configuration directory
         """
-        # Check XDG_CONFIG_HOME first
-        xdg_config = os.environ.get("XDG_CONFIG_HOME")
-        if xdg_config:
-            return Path(xdg_config) / self.app_name
-
-        # Default to ~/.config/app_name
-        return Path.home() / ".config" / self.app_name
+        # XDG_CONFIG_HOME takes precedence over ~/.config/app_name
+        return _user_dir(
+            os.environ.get("XDG_CONFIG_HOME"), os.environ.get("HOME"), ".config", self.app_name
+        )
 
     def get_data_dir(self) -> Path:
         """Get the data directory path.
@@ -421,13 +480,10 @@ class ConfigManager:
         Returns:
             Path to data directory
         """
-        # Check XDG_DATA_HOME first
-        xdg_data = os.environ.get("XDG_DATA_HOME")
-        if xdg_data:
-            return Path(xdg_data) / self.app_name
-
-        # Default to ~/.local/share/app_name
-        return Path.home() / ".local" / "share" / self.app_name
+        # XDG_DATA_HOME takes precedence over ~/.local/share/app_name
+        return _user_dir(
+            os.environ.get("XDG_DATA_HOME"), os.environ.get("HOME"), ".local/share", self.app_name
+        )
 
     def get_cache_dir(self) -> Path:
         """Get the cache directory path.
@@ -435,13 +491,10 @@ class ConfigManager:
         Returns:
             Path to cache directory
         """
-        # Check XDG_CACHE_HOME first
-        xdg_cache = os.environ.get("XDG_CACHE_HOME")
-        if xdg_cache:
-            return Path(xdg_cache) / self.app_name
-
-        # Default to ~/.cache/app_name
-        return Path.home() / ".cache" / self.app_name
+        # XDG_CACHE_HOME takes precedence over ~/.cache/app_name
+        return _user_dir(
+            os.environ.get("XDG_CACHE_HOME"), os.environ.get("HOME"), ".cache", self.app_name
+        )
 
     def save(self, path: Path, format: ConfigFormat = ConfigFormat.JSON) -> None:
         """Save configuration to a file.
@@ -459,22 +512,19 @@ class ConfigManager:
             with open(path, "w") as f:
                 json.dump(config_dict, f, indent=2)
         elif format == ConfigFormat.TOML:
-            # Try to use tomli-w if available
-            try:
-                import tomli_w
+            if not _HAS_TOMLI_W:
+                raise ImportError("tomli-w is required for saving TOML files")
+            import tomli_w
 
-                with open(path, "wb") as f:
-                    tomli_w.dump(config_dict, f)
-            except ImportError:
-                raise ImportError("tomli-w is required for saving TOML files") from None
+            with open(path, "wb") as f:
+                tomli_w.dump(config_dict, f)
         elif format == ConfigFormat.YAML:
-            try:
-                import yaml
+            if not _HAS_YAML:
+                raise ImportError("PyYAML is required for saving YAML files")
+            import yaml
 
-                with open(path, "w") as f:
-                    yaml.dump(config_dict, f, default_flow_style=False)
-            except ImportError:
-                raise ImportError("PyYAML is required for saving YAML files") from None
+            with open(path, "w") as f:
+                yaml.dump(config_dict, f, default_flow_style=False)
         else:
             raise ValueError(f"Unsupported format for saving: {format}")
 
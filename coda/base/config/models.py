@@ -117,10 +117,17 @@ class LayeredConfig:
         return self._merged
 
     def _merge_dict(self, target: dict[str, Any], source: dict[str, Any]) -> None:
-        """Recursively merge source dict into target dict."""
+        """Recursively merge source dict into target dict.
+
+        Nested dicts are copied into target rather than shared, so merging never
+        writes into a layer and layers can be shared between configs.
+        """
         for key, value in source.items():
-            if key in target and isinstance(target[key], dict) and isinstance(value, dict):
-                self._merge_dict(target[key], value)
+            if isinstance(value, dict):
+                existing = target.get(key)
+                if not isinstance(existing, dict):
+                    existing = target[key] = {}
+                self._merge_dict(existing, value)
             else:
                 target[key] = value
 
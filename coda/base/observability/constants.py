@@ -18,12 +18,22 @@ ENV_PREFIX: str = "CODA_"
 ENV_OBSERVABILITY_ENABLED: str = "CODA_OBSERVABILITY_ENABLED"
 ENV_OBSERVABILITY_EXPORT_DIR: str = "CODA_OBSERVABILITY_EXPORT_DIR"
 ENV_METRICS_FLUSH_INTERVAL: str = "CODA_METRICS_FLUSH_INTERVAL"
+ENV_METRICS_MAX_MEMORY_MB: str = "CODA_METRICS_MAX_MEMORY_MB"
 ENV_TRACING_SAMPLE_RATE: str = "CODA_TRACING_SAMPLE_RATE"
 ENV_TRACING_MAX_SPANS: str = "CODA_TRACING_MAX_SPANS"
 ENV_TRACING_FLUSH_INTERVAL: str = "CODA_TRACING_FLUSH_INTERVAL"
+ENV_TRACING_MAX_MEMORY_MB: str = "CODA_TRACING_MAX_MEMORY_MB"
 ENV_HEALTH_CHECK_INTERVAL: str = "CODA_HEALTH_CHECK_INTERVAL"
 ENV_HEALTH_UNHEALTHY_THRESHOLD: str = "CODA_HEALTH_UNHEALTHY_THRESHOLD"
 ENV_HEALTH_DEGRADED_THRESHOLD: str = "CODA_HEALTH_DEGRADED_THRESHOLD"
+ENV_ERROR_TRACKING_ENABLED: str = "CODA_ERROR_TRACKING_ENABLED"
+ENV_ERROR_TRACKING_MAX_STACK_LENGTH: str = "CODA_ERROR_TRACKING_MAX_STACK_LENGTH"
+ENV_ERROR_TRACKING_FLUSH_INTERVAL: str = "CODA_ERROR_TRACKING_FLUSH_INTERVAL"
+ENV_PROFILING_ENABLED: str = "CODA_PROFILING_ENABLED"
+ENV_PROFILING_DEBUG_MODE_ONLY: str = "CODA_PROFILING_DEBUG_MODE_ONLY"
+ENV_PROFILING_MIN_DURATION_MS: str = "CODA_PROFILING_MIN_DURATION_MS"
+ENV_PROFILING_TRACK_MEMORY: str = "CODA_PROFILING_TRACK_MEMORY"
+ENV_PROFILING_FLUSH_INTERVAL: str = "CODA_PROFILING_FLUSH_INTERVAL"
 
 # Directory names
 OBSERVABILITY_DIR: str = "observability"
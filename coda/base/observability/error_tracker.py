@@ -16,7 +16,11 @@ from typing import Any
 
 from ..config import ConfigManager
 from .base import ObservabilityComponent
-from .constants import ENV_PREFIX
+from .constants import (
+    ENV_ERROR_TRACKING_ENABLED,
+    ENV_ERROR_TRACKING_FLUSH_INTERVAL,
+    ENV_ERROR_TRACKING_MAX_STACK_LENGTH,
+)
 from .sanitizer import DataSanitizer
 
 
@@ -131,13 +135,13 @@ class ErrorTracker(ObservabilityComponent):
         self.enabled = config_manager.get_bool(
             "observability.error_tracking.enabled",
             default=True,
-            env_var=f"{ENV_PREFIX}ERROR_TRACKING_ENABLED",
+            env_var=ENV_ERROR_TRACKING_ENABLED,
         )
 
         self.max_stack_trace_length = config_manager.get_int(
             "observability.error_tracking.max_stack_trace_length",
             default=5000,
-            env_var=f"{ENV_PREFIX}ERROR_TRACKING_MAX_STACK_LENGTH",
+            env_var=ENV_ERROR_TRACKING_MAX_STACK_LENGTH,
         )
 
         # Alert callbacks
@@ -165,7 +169,7 @@ class ErrorTracker(ObservabilityComponent):
         return self.config_manager.get_int(
             "observability.error_tracking.flush_interval",
             default=300,  # 5 minutes
-            env_var=f"{ENV_PREFIX}ERROR_TRACKING_FLUSH_INTERVAL",
+            env_var=ENV_ERROR_TRACKING_FLUSH_INTERVAL,
         )
 
     def start(self):
@@ -13,12 +13,17 @@ from collections import defaultdict, deque
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
 from ..config import ConfigManager
 from .base import ObservabilityComponent
-from .constants import ENV_PREFIX
+from .constants import (
+    ENV_HEALTH_CHECK_INTERVAL,
+    ENV_HEALTH_DEGRADED_THRESHOLD,
+    ENV_HEALTH_UNHEALTHY_THRESHOLD,
+)
 
 
 @dataclass
@@ -51,7 +56,7 @@ class ComponentHealth:
     name: str
     status: str  # healthy, degraded, unhealthy
     last_check: datetime
-    checks: list[HealthCheck]
+    checks: deque[HealthCheck]  # bounded to the most recent checks
     uptime_percentage: float = 100.0
 
     def to_dict(self) -> dict[str, Any]:
@@ -93,13 +98,13 @@ class HealthMonitor(ObservabilityComponent):
         self.unhealthy_threshold = config_manager.get_int(
             "observability.health.unhealthy_threshold",
             default=3,  # 3 consecutive failures
-            env_var=f"{ENV_PREFIX}HEALTH_UNHEALTHY_THRESHOLD",
+            env_var=ENV_HEALTH_UNHEALTHY_THRESHOLD,
         )
 
         self.degraded_threshold = config_manager.get_float(
             "observability.health.degraded_threshold",
             default=5000.0,  # 5 seconds response time
-            env_var=f"{ENV_PREFIX}HEALTH_DEGRADED_THRESHOLD",
+            env_var=ENV_HEALTH_DEGRADED_THRESHOLD,
         )
 
         # Health check functions
@@ -120,7 +125,7 @@ class HealthMonitor(ObservabilityComponent):
         return self.config_manager.get_int(
             "observability.health.check_interval",
             default=30,  # 30 seconds
-            env_var=f"{ENV_PREFIX}HEALTH_CHECK_INTERVAL",
+            env_var=ENV_HEALTH_CHECK_INTERVAL,
         )
 
     def _flush_data(self) -> None:
@@ -155,17 +160,17 @@ class HealthMonitor(ObservabilityComponent):
             # Update component health
             if result.name not in self.component_health:
                 self.component_health[result.name] = ComponentHealth(
-                    name=result.name, status="healthy", last_check=result.timestamp, checks=[]
+                    name=result.name,
+                    status="healthy",
+                    last_check=result.timestamp,
+                    checks=deque(maxlen=100),
                 )
 
             component = self.component_health[result.name]
             component.last_check = result.timestamp
+            # The deque keeps only the most recent checks (last 100)
             component.checks.append(result)
 
-            # Keep only recent checks (last 100)
-            if len(component.checks) > 100:
-                component.checks = component.checks[-100:]
-
             # Update component status based on recent checks
             component.status = self._calculate_component_status(result.name)
             component.uptime_percentage = self._calculate_uptime(result.name)
@@ -179,12 +184,12 @@ class HealthMonitor(ObservabilityComponent):
         if not component.checks:
             return "unknown"
 
-        # Get recent checks (last 10)
-        recent_checks = component.checks[-10:]
+        # Get recent checks (last 10), newest first
+        recent_checks = list(islice(reversed(component.checks), 10))
 
         # Count consecutive failures
         consecutive_failures = 0
-        for check in reversed(recent_checks):
+        for check in recent_checks:
             if check.status == "unhealthy":
                 consecutive_failures += 1
             else:
@@ -9,7 +9,7 @@ from pathlib import Path
 from typing import Any
 
 from ..config import ConfigManager
-from .constants import ENV_PREFIX
+from .constants import ENV_OBSERVABILITY_ENABLED, ENV_OBSERVABILITY_EXPORT_DIR
 from .error_tracker import ErrorCategory, ErrorSeverity, ErrorTracker
 from .health import HealthMonitor
 from .metrics import MetricsCollector
@@ -52,7 +52,7 @@ class ObservabilityManager:
         # Check environment variable first
         import os
 
-        env_value = os.environ.get(f"{ENV_PREFIX}OBSERVABILITY_ENABLED")
+        env_value = os.environ.get(ENV_OBSERVABILITY_ENABLED)
         if env_value is not None:
             return env_value.lower() in ("true", "1", "yes", "on")
 
@@ -64,7 +64,7 @@ class ObservabilityManager:
         # Check environment variable first
         import os
 
-        env_value = os.environ.get(f"{ENV_PREFIX}OBSERVABILITY_EXPORT_DIR")
+        env_value = os.environ.get(ENV_OBSERVABILITY_EXPORT_DIR)
         if env_value:
             export_dir = Path(env_value)
         else:
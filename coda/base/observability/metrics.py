@@ -18,7 +18,7 @@ from typing import Any
 from ..config import ConfigManager
 from .base import ObservabilityComponent
 from .collections import MemoryAwareDeque
-from .constants import ENV_PREFIX
+from .constants import ENV_METRICS_FLUSH_INTERVAL, ENV_METRICS_MAX_MEMORY_MB
 
 logger = logging.getLogger(__name__)
 
@@ -117,7 +117,7 @@ class MetricsCollector(ObservabilityComponent):
         max_memory_mb = config_manager.get_float(
             "observability.metrics.max_memory_mb",
             default=50.0,
-            env_var=f"{ENV_PREFIX}METRICS_MAX_MEMORY_MB",
+            env_var=ENV_METRICS_MAX_MEMORY_MB,
         )
         self.error_log = MemoryAwareDeque(
             maxlen=10000,  # Keep last 10k errors max
@@ -139,7 +139,7 @@ class MetricsCollector(ObservabilityComponent):
         return self.config_manager.get_int(
             "observability.metrics.flush_interval",
             default=300,  # 5 minutes
-            env_var=f"{ENV_PREFIX}METRICS_FLUSH_INTERVAL",
+            env_var=ENV_METRICS_FLUSH_INTERVAL,
         )
 
     def record_session_event(self, event_type: str, metadata: dict[str, Any]):
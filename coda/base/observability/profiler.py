@@ -17,7 +17,13 @@ from typing import Any
 
 from ..config import ConfigManager
 from .base import ObservabilityComponent
-from .constants import ENV_PREFIX
+from .constants import (
+    ENV_PROFILING_DEBUG_MODE_ONLY,
+    ENV_PROFILING_ENABLED,
+    ENV_PROFILING_FLUSH_INTERVAL,
+    ENV_PROFILING_MIN_DURATION_MS,
+    ENV_PROFILING_TRACK_MEMORY,
+)
 
 
 @dataclass
@@ -100,25 +106,25 @@ class PerformanceProfiler(ObservabilityComponent):
         self.enabled = config_manager.get_bool(
             "observability.profiling.enabled",
             default=False,  # Disabled by default
-            env_var=f"{ENV_PREFIX}PROFILING_ENABLED",
+            env_var=ENV_PROFILING_ENABLED,
         )
 
         self.debug_mode_only = config_manager.get_bool(
             "observability.profiling.debug_mode_only",
             default=True,
-            env_var=f"{ENV_PREFIX}PROFILING_DEBUG_MODE_ONLY",
+            env_var=ENV_PROFILING_DEBUG_MODE_ONLY,
         )
 
         self.min_duration_ms = config_manager.get_float(
             "observability.profiling.min_duration_ms",
             default=1.0,  # Only profile functions taking >= 1ms
-            env_var=f"{ENV_PREFIX}PROFILING_MIN_DURATION_MS",
+            env_var=ENV_PROFILING_MIN_DURATION_MS,
         )
 
         self.track_memory = config_manager.get_bool(
             "observability.profiling.track_memory",
             default=False,  # Memory tracking can be expensive
-            env_var=f"{ENV_PREFIX}PROFILING_TRACK_MEMORY",
+            env_var=ENV_PROFILING_TRACK_MEMORY,
         )
 
         # Memory tracking
@@ -143,7 +149,7 @@ class PerformanceProfiler(ObservabilityComponent):
         return self.config_manager.get_int(
             "observability.profiling.flush_interval",
             default=600,  # 10 minutes
-            env_var=f"{ENV_PREFIX}PROFILING_FLUSH_INTERVAL",
+            env_var=ENV_PROFILING_FLUSH_INTERVAL,
         )
 
     def start(self):
@@ -17,7 +17,12 @@ from typing import Any
 from ..config import ConfigManager
 from .base import ObservabilityComponent
 from .collections import BoundedCache
-from .constants import ENV_PREFIX
+from .constants import (
+    ENV_TRACING_FLUSH_INTERVAL,
+    ENV_TRACING_MAX_MEMORY_MB,
+    ENV_TRACING_MAX_SPANS,
+    ENV_TRACING_SAMPLE_RATE,
+)
 
 
 @dataclass
@@ -154,7 +159,7 @@ class TracingManager(ObservabilityComponent):
         max_memory_mb = config_manager.get_float(
             "observability.tracing.max_memory_mb",
             default=100.0,
-            env_var=f"{ENV_PREFIX}TRACING_MAX_MEMORY_MB",
+            env_var=ENV_TRACING_MAX_MEMORY_MB,
         )
         self.completed_traces_cache = BoundedCache(
             max_size=1000,  # Max 1000 traces
@@ -167,13 +172,13 @@ class TracingManager(ObservabilityComponent):
         self.sample_rate = config_manager.get_float(
             "observability.tracing.sample_rate",
             default=1.0,  # Sample 100% by default
-            env_var=f"{ENV_PREFIX}TRACING_SAMPLE_RATE",
+            env_var=ENV_TRACING_SAMPLE_RATE,
         )
 
         self.max_spans_per_trace = config_manager.get_int(
             "observability.tracing.max_spans_per_trace",
             default=1000,
-            env_var=f"{ENV_PREFIX}TRACING_MAX_SPANS",
+            env_var=ENV_TRACING_MAX_SPANS,
         )
 
         # Span ID generation
@@ -191,7 +196,7 @@ class TracingManager(ObservabilityComponent):
         return self.config_manager.get_int(
             "observability.tracing.flush_interval",
             default=60,  # 1 minute
-            env_var=f"{ENV_PREFIX}TRACING_FLUSH_INTERVAL",
+            env_var=ENV_TRACING_FLUSH_INTERVAL,
         )
 
     def stop(self):
@@ -2,9 +2,11 @@
 Provider implementations for Coda.
 
 This module provides a unified interface for various LLM providers.
-Providers with external dependencies are imported conditionally.
+Providers with external dependencies are imported lazily on first use.
 """
 
+from importlib.util import find_spec
+
 # Always available - core functionality
 from .base import (
     BaseProvider,
@@ -21,23 +23,20 @@ from .constants import PROVIDERS
 from .mock_provider import MockProvider
 from .registry import ProviderFactory, ProviderRegistry
 
-# Optional providers - require external dependencies
-try:
-    from .litellm_provider import LiteLLMProvider
-except ImportError:
-    LiteLLMProvider = None  # type: ignore
-
-try:
-    from .oci_genai import OCIGenAIProvider
-except ImportError:
-    OCIGenAIProvider = None  # type: ignore
+# Optional providers - require external dependencies, imported on first access
+_OPTIONAL_PROVIDERS = {
+    "LiteLLMProvider": ".litellm_provider",
+    "OCIGenAIProvider": ".oci_genai",
+    "OllamaProvider": ".ollama_provider",
+}
 
-try:
-    from .ollama_provider import OllamaProvider
-except ImportError:
-    OllamaProvider = None  # type: ignore
+# SDK each optional provider needs; only providers whose SDK is installed are exported
+_PROVIDER_REQUIREMENTS = {
+    "LiteLLMProvider": "litellm",
+    "OCIGenAIProvider": "oci",
+    "OllamaProvider": "httpx",
+}
 
-# Build __all__ dynamically based on available providers
 __all__ = [
     # Base classes and types
     "BaseProvider",
@@ -54,12 +53,21 @@ __all__ = [
     "ProviderRegistry",
     "ProviderFactory",
     "PROVIDERS",
+    # Optional, if their SDK is installed
+    *(name for name, sdk in _PROVIDER_REQUIREMENTS.items() if find_spec(sdk) is not None),
 ]
 
-# Add optional providers if available
-if LiteLLMProvider is not None:
-    __all__.append("LiteLLMProvider")
-if OCIGenAIProvider is not None:
-    __all__.append("OCIGenAIProvider")
-if OllamaProvider is not None:
-    __all__.append("OllamaProvider")
+
+def __getattr__(name: str):
+    """Import optional provider classes on first access."""
+    if name not in _OPTIONAL_PROVIDERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    try:
+        provider_class = getattr(importlib.import_module(_OPTIONAL_PROVIDERS[name], __name__), name)
+    except ImportError:
+        provider_class = None
+    globals()[name] = provider_class
+    return provider_class
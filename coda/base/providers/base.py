@@ -44,9 +44,12 @@ class ToolResult:
     is_error: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
-    """Chat message."""
+    """Chat message.
+
+    Uses ``__slots__`` since long sessions hold many of these in history.
+    """
 
     role: Role
     content: str
@@ -68,9 +71,12 @@ class ChatCompletion:
     metadata: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatCompletionChunk:
-    """Streaming chat completion chunk."""
+    """Streaming chat completion chunk.
+
+    Uses ``__slots__`` since a streamed response creates one per token batch.
+    """
 
     content: str
     model: str
@@ -80,9 +86,12 @@ class ChatCompletionChunk:
     metadata: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Model:
-    """Model information."""
+    """Model information.
+
+    Uses ``__slots__`` since provider model listings can hold hundreds of these.
+    """
 
     id: str
     name: str
@@ -4,8 +4,11 @@ This module contains all constants needed by the providers module,
 making it self-contained and independent of other Coda modules.
 """
 
+from dataclasses import dataclass
 
-class PROVIDERS:
+
+@dataclass(frozen=True, slots=True)
+class _Providers:
     """Provider identifiers."""
 
     OCI_GENAI: str = "oci_genai"
@@ -14,16 +17,11 @@ class PROVIDERS:
     MOCK: str = "mock"
     OPENAI: str = "openai"
 
-    @property
-    def ALL(self) -> list[str]:
-        """Return all provider names."""
-        return [
-            self.OCI_GENAI,
-            self.LITELLM,
-            self.OLLAMA,
-            self.MOCK,
-            self.OPENAI,
-        ]
+    # All provider names, in registration order
+    ALL: tuple[str, ...] = (OCI_GENAI, LITELLM, OLLAMA, MOCK, OPENAI)
+
+
+PROVIDERS = _Providers()
 
 
 # Model defaults
@@ -3,8 +3,8 @@
 import asyncio
 import json
 import os
+import time
 from collections.abc import AsyncIterator, Iterator
-from datetime import datetime
 from pathlib import Path
 from typing import Any
 
@@ -53,7 +53,7 @@ class OCIGenAIProvider(BaseProvider):
 
     # Cache for discovered models
     _model_cache: list[Model] | None = None
-    _cache_timestamp: datetime | None = None
+    _cache_timestamp: float | None = None  # time.monotonic() of the last refresh
     _cache_duration_hours = 24  # Cache models for 24 hours
     _model_id_map: dict[str, str] = {}  # Maps friendly names to OCI model IDs
 
@@ -123,11 +123,11 @@ class OCIGenAIProvider(BaseProvider):
 
     def _is_cache_valid(self) -> bool:
         """Check if the model cache is still valid."""
-        if not self._cache_timestamp or not self._model_cache:
+        if self._cache_timestamp is None or not self._model_cache:
             return False
 
-        age = datetime.now() - self._cache_timestamp
-        return age.total_seconds() < (self._cache_duration_hours * 3600)
+        age = time.monotonic() - self._cache_timestamp
+        return age < (self._cache_duration_hours * 3600)
 
     def _get_model_context_length(self, model_id: str) -> int:
         """Get accurate context length for a model.
@@ -912,7 +912,7 @@ IMPORTANT: After receiving tool results, you MUST provide a final answer to the
 
         # Update cache
         self._model_cache = models
-        self._cache_timestamp = datetime.now()
+        self._cache_timestamp = time.monotonic()
 
         return models
 
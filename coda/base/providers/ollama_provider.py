@@ -1,6 +1,7 @@
 """Ollama provider implementation for local model execution."""
 
 import json
+import time
 from collections.abc import AsyncIterator, Iterator
 from typing import TypeVar
 
@@ -31,6 +32,12 @@ T = TypeVar("T")
 class OllamaProvider(HTTPClientMixin, BaseProvider):
     """Ollama provider for local LLM execution."""
 
+    # Cache for listed models. Local models only change on pull/rm, and completion
+    # and every chat turn look them up, so keep them briefly instead of re-querying.
+    _model_cache: list[Model] | None = None
+    _cache_timestamp: float | None = None  # time.monotonic() of the last refresh
+    _cache_duration_seconds = 60
+
     def __init__(self, host: str = "http://localhost:11434", timeout: float = 120.0, **kwargs):
         """
         Initialize Ollama provider.
@@ -711,8 +718,19 @@ class OllamaProvider(HTTPClientMixin, BaseProvider):
                     except json.JSONDecodeError:
                         continue
 
+    def _is_cache_valid(self) -> bool:
+        """Check if the model cache is still valid."""
+        if self._cache_timestamp is None or not self._model_cache:
+            return False
+
+        return time.monotonic() - self._cache_timestamp < self._cache_duration_seconds
+
     def list_models(self) -> list[Model]:
         """List available models from Ollama."""
+        # Check cache first
+        if self._is_cache_valid():
+            return self._model_cache
+
         try:
             response = self.client.get(f"{self.host}/api/tags")
             response.raise_for_status()
@@ -723,6 +741,10 @@ class OllamaProvider(HTTPClientMixin, BaseProvider):
             for model_data in data.get("models", []):
                 models.append(self._extract_model_info(model_data))
 
+            # Update cache
+            self._model_cache = models
+            self._cache_timestamp = time.monotonic()
+
             return models
 
         except Exception as e:
@@ -730,6 +752,12 @@ class OllamaProvider(HTTPClientMixin, BaseProvider):
             print(f"Warning: Could not list Ollama models: {e}")
             return []
 
+    def refresh_models(self) -> list[Model]:
+        """Force refresh of the model cache."""
+        self._model_cache = None
+        self._cache_timestamp = None
+        return self.list_models()
+
     def pull_model(self, model: str) -> None:
         """Pull a model from Ollama registry."""
         try:
@@ -749,6 +777,10 @@ class OllamaProvider(HTTPClientMixin, BaseProvider):
                     if status:
                         print(f"Ollama: {status}")
 
+            # The pulled model should show up in the next listing
+            self._model_cache = None
+            self._cache_timestamp = None
+
         except Exception as e:
             raise RuntimeError(f"Failed to pull model '{model}': {str(e)}") from e
 
@@ -761,6 +793,9 @@ class OllamaProvider(HTTPClientMixin, BaseProvider):
             )
             response.raise_for_status()
 
+            self._model_cache = None
+            self._cache_timestamp = None
+
         except Exception as e:
             raise RuntimeError(f"Failed to delete model '{model}': {str(e)}") from e
 
@@ -1,5 +1,7 @@
 """Provider registry and factory for managing LLM providers."""
 
+import importlib
+from importlib.util import find_spec
 from typing import Any
 
 from .base import BaseProvider
@@ -11,6 +13,8 @@ class ProviderRegistry:
     """Registry for managing available providers."""
 
     _providers: dict[str, type[BaseProvider]] = {}
+    _lazy_providers: dict[str, str] = {}
+    _lazy_requirements: dict[str, str] = {}
     _instances: dict[str, BaseProvider] = {}
 
     @classmethod
@@ -25,6 +29,47 @@ class ProviderRegistry:
         if not issubclass(provider_class, BaseProvider):
             raise TypeError(f"Provider {provider_class} must inherit from BaseProvider")
         cls._providers[name] = provider_class
+        cls._lazy_providers.pop(name, None)
+        cls._lazy_requirements.pop(name, None)
+
+    @classmethod
+    def register_lazy(cls, name: str, import_path: str, requires: str | None = None) -> None:
+        """
+        Register a provider class by import path without importing it.
+
+        The provider module (and its SDK) is only imported the first time the
+        provider is requested.
+
+        Args:
+            name: Provider name
+            import_path: Import path in ``"module:ClassName"`` form; relative
+                module paths are resolved against this package
+            requires: Top-level module the provider depends on; the provider is
+                only listed while that module is installed
+        """
+        if name not in cls._providers:
+            cls._lazy_providers[name] = import_path
+            if requires is not None:
+                cls._lazy_requirements[name] = requires
+
+    @classmethod
+    def _resolve(cls, name: str) -> type[BaseProvider] | None:
+        """Return the provider class for ``name``, importing it on first use."""
+        provider_class = cls._providers.get(name)
+        if provider_class is not None or name not in cls._lazy_providers:
+            return provider_class
+
+        module_name, class_name = cls._lazy_providers[name].rsplit(":", 1)
+        try:
+            module = importlib.import_module(module_name, __package__)
+        except ImportError:
+            # Provider dependencies not installed - drop it from the registry
+            cls._lazy_providers.pop(name, None)
+            cls._lazy_requirements.pop(name, None)
+            return None
+
+        cls.register(name, getattr(module, class_name))
+        return cls._providers[name]
 
     @classmethod
     def get_provider_class(cls, name: str) -> type[BaseProvider] | None:
@@ -37,17 +82,28 @@ class ProviderRegistry:
         Returns:
             Provider class if registered, None otherwise
         """
-        return cls._providers.get(name)
+        return cls._resolve(name)
 
     @classmethod
     def list_providers(cls) -> list[str]:
         """
         List all registered provider names.
 
+        Lazily registered providers are listed without being imported, as long
+        as the module they require is installed.
+
         Returns:
             List of provider names
         """
-        return list(cls._providers.keys())
+        return [
+            *cls._providers,
+            *(
+                name
+                for name in cls._lazy_providers
+                if name not in cls._lazy_requirements
+                or find_spec(cls._lazy_requirements[name]) is not None
+            ),
+        ]
 
     @classmethod
     def _hash_config(cls, config: dict) -> str:
@@ -88,9 +144,9 @@ class ProviderRegistry:
         Raises:
             ValueError: If provider is not registered
         """
-        provider_class = cls._providers.get(name)
+        provider_class = cls._resolve(name)
         if not provider_class:
-            available = ", ".join(cls._providers.keys())
+            available = ", ".join(cls.list_providers())
             raise ValueError(f"Unknown provider: {name}. Available providers: {available}")
 
         # Create a unique key for this provider instance
@@ -114,27 +170,10 @@ class ProviderRegistry:
 # Register built-in providers - always available
 ProviderRegistry.register(PROVIDERS.MOCK, MockProvider)
 
-# Register optional providers if available
-try:
-    from .oci_genai import OCIGenAIProvider
-
-    ProviderRegistry.register(PROVIDERS.OCI_GENAI, OCIGenAIProvider)
-except ImportError:
-    pass  # OCI provider not available
-
-try:
-    from .litellm_provider import LiteLLMProvider
-
-    ProviderRegistry.register(PROVIDERS.LITELLM, LiteLLMProvider)
-except ImportError:
-    pass  # LiteLLM provider not available
-
-try:
-    from .ollama_provider import OllamaProvider
-
-    ProviderRegistry.register(PROVIDERS.OLLAMA, OllamaProvider)
-except ImportError:
-    pass  # Ollama provider not available
+# Register optional providers lazily - their SDKs are imported on first use
+ProviderRegistry.register_lazy(PROVIDERS.OCI_GENAI, ".oci_genai:OCIGenAIProvider", "oci")
+ProviderRegistry.register_lazy(PROVIDERS.LITELLM, ".litellm_provider:LiteLLMProvider", "litellm")
+ProviderRegistry.register_lazy(PROVIDERS.OLLAMA, ".ollama_provider:OllamaProvider", "httpx")
 
 
 class ProviderFactory:
@@ -169,11 +208,23 @@ class ProviderFactory:
         # Create provider
         return ProviderRegistry.create_provider(provider_name, **merged_config)
 
-    def list_available(self) -> list[str]:
-        """List available provider names."""
+    @staticmethod
+    def list_available() -> list[str]:
+        """List available provider names.
+
+        Does not require a factory instance or import any provider module.
+        """
         return ProviderRegistry.list_providers()
 
 
 def get_provider_registry() -> dict[str, type[BaseProvider]]:
-    """Get the current provider registry as a dictionary."""
-    return ProviderRegistry._providers.copy()
+    """Get the current provider registry as a dictionary.
+
+    This resolves every lazily registered provider, importing its module.
+    """
+    registry = {}
+    for name in ProviderRegistry.list_providers():
+        provider_class = ProviderRegistry.get_provider_class(name)
+        if provider_class is not None:
+            registry[name] = provider_class
+    return registry
@@ -43,21 +43,12 @@ from .vector_search.embeddings.mock import MockEmbeddingProvider
 from .vector_search.vector_stores.base import BaseVectorStore, SearchResult
 from .vector_search.vector_stores.faiss_store import FAISSVectorStore
 
-# Optional vector search providers (conditionally imported)
-try:
-    from .vector_search.embeddings.oci import OCIEmbeddingProvider
-except ImportError:
-    OCIEmbeddingProvider = None
-
-try:
-    from .vector_search.embeddings.ollama import OllamaEmbeddingProvider
-except ImportError:
-    OllamaEmbeddingProvider = None
-
-try:
-    from .vector_search.embeddings.sentence_transformers import SentenceTransformersProvider
-except ImportError:
-    SentenceTransformersProvider = None
+# Optional vector search providers - resolved lazily by the vector search package
+_OPTIONAL_PROVIDERS = (
+    "OCIEmbeddingProvider",
+    "OllamaEmbeddingProvider",
+    "SentenceTransformersProvider",
+)
 
 __all__ = [
     # Repository mapping
@@ -81,3 +72,14 @@ __all__ = [
     "OllamaEmbeddingProvider",
     "SentenceTransformersProvider",
 ]
+
+
+def __getattr__(name: str):
+    """Import optional embedding providers on first access."""
+    if name not in _OPTIONAL_PROVIDERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from . import vector_search
+
+    provider_class = globals()[name] = getattr(vector_search, name)
+    return provider_class
@@ -1,8 +1,31 @@
 """Constants for the search module.
 
-All search-related constants are defined here to make the module self-contained.
+All search-related constants are available here. The search and embedding
+constants shared with the vector search package are defined there and re-exported.
 """
 
+from .vector_search.constants import (  # noqa: F401
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_CHUNK_OVERLAP,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_EMBEDDING_DIMENSION,
+    DEFAULT_INDEX_TYPE,
+    DEFAULT_SIMILARITY_METRIC,
+    DEFAULT_SIMILARITY_THRESHOLD,
+    MAX_BATCH_SIZE,
+    MAX_CACHE_SIZE,
+    MAX_RETRIES,
+    MIN_CHUNK_SIZE,
+    PROVIDER_MOCK,
+    PROVIDER_OCI,
+    PROVIDER_OLLAMA,
+    PROVIDER_SENTENCE_TRANSFORMERS,
+    RETRY_DELAY,
+    SUPPORTED_CODE_EXTENSIONS,
+    SUPPORTED_TEXT_EXTENSIONS,
+)
+
 # === Repository Analysis Constants ===
 
 # Supported file extensions for analysis
@@ -52,58 +75,6 @@ DEFAULT_EXCLUDE_PATTERNS: list[str] = [
 # Tree-sitter query directories
 QUERIES_DIR: str = "queries"
 
-# === Search and Embedding Constants ===
-
-# Default chunking parameters
-DEFAULT_CHUNK_SIZE: int = 1000
-DEFAULT_CHUNK_OVERLAP: int = 200
-MIN_CHUNK_SIZE: int = 100
-
-# Default embedding dimensions
-DEFAULT_EMBEDDING_DIMENSION: int = 768
-
-# Vector store defaults
-DEFAULT_INDEX_TYPE: str = "Flat"  # FAISS index type
-DEFAULT_SIMILARITY_METRIC: str = "cosine"
-
-# Search defaults
-DEFAULT_SIMILARITY_THRESHOLD: float = 0.7
-
-# File processing for search
-SUPPORTED_TEXT_EXTENSIONS: list[str] = [
-    ".txt",
-    ".md",
-    ".rst",
-    ".doc",
-    ".docx",
-    ".pdf",
-    ".html",
-    ".xml",
-    ".json",
-    ".yaml",
-    ".yml",
-]
-
-SUPPORTED_CODE_EXTENSIONS: list[str] = list(SUPPORTED_LANGUAGES.keys())
-
-# Embedding provider types
-PROVIDER_MOCK: str = "mock"
-PROVIDER_OCI: str = "oci"
-PROVIDER_OLLAMA: str = "ollama"
-PROVIDER_SENTENCE_TRANSFORMERS: str = "sentence_transformers"
-
-# Cache and storage
-DEFAULT_CACHE_TTL: int = 3600  # 1 hour in seconds
-MAX_CACHE_SIZE: int = 1000  # Maximum cached items
-
-# Batch processing
-DEFAULT_BATCH_SIZE: int = 100
-MAX_BATCH_SIZE: int = 1000
-
-# Error handling
-MAX_RETRIES: int = 3
-RETRY_DELAY: float = 1.0  # seconds
-
 # === Integration Constants ===
 
 # Default index directory name
@@ -34,21 +34,13 @@ from .manager import SemanticSearchManager
 from .vector_stores.base import BaseVectorStore, SearchResult
 from .vector_stores.faiss_store import FAISSVectorStore
 
-# Optional providers (conditionally imported)
-try:
-    from .embeddings.oci import OCIEmbeddingProvider
-except ImportError:
-    OCIEmbeddingProvider = None
-
-try:
-    from .embeddings.ollama import OllamaEmbeddingProvider
-except ImportError:
-    OllamaEmbeddingProvider = None
-
-try:
-    from .embeddings.sentence_transformers import SentenceTransformersProvider
-except ImportError:
-    SentenceTransformersProvider = None
+# Optional providers - resolved lazily by the embeddings package, which owns the
+# table of optional provider modules
+_OPTIONAL_PROVIDERS = (
+    "OCIEmbeddingProvider",
+    "OllamaEmbeddingProvider",
+    "SentenceTransformersProvider",
+)
 
 __all__ = [
     # Core components
@@ -68,3 +60,14 @@ __all__ = [
     "OllamaEmbeddingProvider",
     "SentenceTransformersProvider",
 ]
+
+
+def __getattr__(name: str):
+    """Import optional embedding providers on first access."""
+    if name not in _OPTIONAL_PROVIDERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from . import embeddings
+
+    provider_class = globals()[name] = getattr(embeddings, name)
+    return provider_class
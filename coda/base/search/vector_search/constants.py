@@ -11,6 +11,11 @@ MIN_CHUNK_SIZE: int = 100
 # Default embedding dimensions
 DEFAULT_EMBEDDING_DIMENSION: int = 768
 
+# Mock embedding batches at least this large are computed in a worker thread
+MOCK_THREAD_BATCH_SIZE: int = 256
+# Number of recent texts whose mock embeddings are kept for reuse
+MOCK_EMBEDDING_CACHE_SIZE: int = 1024
+
 # Vector store defaults
 DEFAULT_INDEX_TYPE: str = "Flat"  # FAISS index type
 DEFAULT_SIMILARITY_METRIC: str = "cosine"
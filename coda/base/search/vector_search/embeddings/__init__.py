@@ -5,31 +5,25 @@ This module provides a unified interface for various embedding providers,
 including OCI GenAI, Ollama, and HuggingFace models.
 """
 
+from importlib.util import find_spec
+
 from .base import BaseEmbeddingProvider, EmbeddingResult
 from .factory import EmbeddingProviderFactory, create_embedding_provider
 from .mock import MockEmbeddingProvider
 
-# Optional providers (conditionally imported)
-try:
-    from .oci import (
-        OCIEmbeddingProvider,
-        create_oci_provider_from_coda_config,
-        create_standalone_oci_provider,
-    )
-except ImportError:
-    OCIEmbeddingProvider = None
-    create_oci_provider_from_coda_config = None
-    create_standalone_oci_provider = None
-
-try:
-    from .ollama import OllamaEmbeddingProvider
-except ImportError:
-    OllamaEmbeddingProvider = None
-
-try:
-    from .sentence_transformers import SentenceTransformersProvider
-except ImportError:
-    SentenceTransformersProvider = None
+# Optional providers - require external dependencies (OCI SDK, httpx,
+# sentence-transformers), imported on first access
+_OPTIONAL_EXPORTS = {
+    "OCIEmbeddingProvider": ".oci",
+    "create_oci_provider_from_coda_config": ".oci",
+    "create_standalone_oci_provider": ".oci",
+    "OllamaEmbeddingProvider": ".ollama",
+    "SentenceTransformersProvider": ".sentence_transformers",
+}
+
+# Module each optional provider module needs at import time; names are only
+# exported when it is installed (sentence-transformers is imported on use)
+_MODULE_REQUIREMENTS = {".oci": "oci", ".ollama": "httpx"}
 
 __all__ = [
     "BaseEmbeddingProvider",
@@ -37,20 +31,25 @@ __all__ = [
     "MockEmbeddingProvider",
     "EmbeddingProviderFactory",
     "create_embedding_provider",
+    # Optional, if their dependencies are installed
+    *(
+        name
+        for name, module in _OPTIONAL_EXPORTS.items()
+        if module not in _MODULE_REQUIREMENTS or find_spec(_MODULE_REQUIREMENTS[module])
+    ),
 ]
 
-# Add optional exports if available
-if OCIEmbeddingProvider is not None:
-    __all__.extend(
-        [
-            "OCIEmbeddingProvider",
-            "create_oci_provider_from_coda_config",
-            "create_standalone_oci_provider",
-        ]
-    )
-
-if SentenceTransformersProvider is not None:
-    __all__.append("SentenceTransformersProvider")
-
-if OllamaEmbeddingProvider is not None:
-    __all__.append("OllamaEmbeddingProvider")
+
+def __getattr__(name: str):
+    """Import optional providers on first access."""
+    if name not in _OPTIONAL_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    try:
+        value = getattr(importlib.import_module(_OPTIONAL_EXPORTS[name], __name__), name)
+    except ImportError:
+        value = None
+    globals()[name] = value
+    return value
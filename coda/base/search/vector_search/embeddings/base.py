@@ -59,11 +59,7 @@ class BaseEmbeddingProvider(ABC):
         Returns:
             List of EmbeddingResults
         """
-        results = []
-        for text in texts:
-            result = await self.embed_text(text)
-            results.append(result)
-        return results
+        return [await self.embed_text(text) for text in texts]
 
     @abstractmethod
     async def list_models(self) -> list[dict[str, Any]]:
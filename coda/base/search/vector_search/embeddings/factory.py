@@ -5,45 +5,29 @@ This module provides a unified interface for creating different
 embedding providers based on configuration.
 """
 
+import importlib
 import logging
 from typing import Any
 
 from .base import BaseEmbeddingProvider
 from .mock import MockEmbeddingProvider
 
-# Optional providers (conditionally imported)
-try:
-    from .oci import OCIEmbeddingProvider
-except ImportError:
-    OCIEmbeddingProvider = None
-
-try:
-    from .ollama import OllamaEmbeddingProvider
-except ImportError:
-    OllamaEmbeddingProvider = None
-
-try:
-    from .sentence_transformers import SentenceTransformersProvider
-except ImportError:
-    SentenceTransformersProvider = None
-
 logger = logging.getLogger(__name__)
 
 
 class EmbeddingProviderFactory:
     """Factory for creating embedding providers."""
 
-    # Registry of available providers
-    PROVIDERS = {}
+    # Registry of imported providers
+    PROVIDERS = {"mock": MockEmbeddingProvider}  # Always available
 
-    # Add providers that are available
-    if OCIEmbeddingProvider is not None:
-        PROVIDERS["oci"] = OCIEmbeddingProvider
-    PROVIDERS["mock"] = MockEmbeddingProvider  # Always available
-    if SentenceTransformersProvider is not None:
-        PROVIDERS["sentence-transformers"] = SentenceTransformersProvider
-    if OllamaEmbeddingProvider is not None:
-        PROVIDERS["ollama"] = OllamaEmbeddingProvider
+    # Providers with external dependencies, as "module:ClassName"; each is imported
+    # (and moved into PROVIDERS) the first time it is requested
+    LAZY_PROVIDERS = {
+        "oci": ".oci:OCIEmbeddingProvider",
+        "sentence-transformers": ".sentence_transformers:SentenceTransformersProvider",
+        "ollama": ".ollama:OllamaEmbeddingProvider",
+    }
 
     # Aliases for convenience
     ALIASES = {
@@ -52,6 +36,30 @@ class EmbeddingProviderFactory:
         "local": "sentence-transformers",  # Default local provider
     }
 
+    @classmethod
+    def get_provider_class(cls, provider_type: str) -> type[BaseEmbeddingProvider] | None:
+        """Return the provider class for a type, importing it on first use.
+
+        Args:
+            provider_type: Provider name (aliases are not resolved)
+
+        Returns:
+            Provider class, or None if unknown or its dependencies are missing
+        """
+        provider_class = cls.PROVIDERS.get(provider_type)
+        if provider_class is not None or provider_type not in cls.LAZY_PROVIDERS:
+            return provider_class
+
+        module_name, class_name = cls.LAZY_PROVIDERS.pop(provider_type).rsplit(":", 1)
+        try:
+            module = importlib.import_module(module_name, __package__)
+        except ImportError:
+            # Provider dependencies not installed
+            return None
+
+        provider_class = cls.PROVIDERS[provider_type] = getattr(module, class_name)
+        return provider_class
+
     @classmethod
     def create_provider(
         cls, provider_type: str, model_id: str | None = None, **kwargs
@@ -74,9 +82,14 @@ class EmbeddingProviderFactory:
         provider_type = cls.ALIASES.get(provider_type, provider_type)
 
         # Get provider class
-        provider_class = cls.PROVIDERS.get(provider_type)
+        provider_class = cls.get_provider_class(provider_type)
         if not provider_class:
-            available = list(cls.PROVIDERS.keys()) + list(cls.ALIASES.keys())
+            installed = [
+                name
+                for name in [*cls.PROVIDERS, *cls.LAZY_PROVIDERS]
+                if cls.get_provider_class(name) is not None
+            ]
+            available = installed + list(cls.ALIASES.keys())
             raise ValueError(
                 f"Unknown provider type: {provider_type}. Available: {', '.join(available)}"
             )
@@ -96,8 +109,6 @@ class EmbeddingProviderFactory:
         try:
             if provider_type == "oci":
                 # OCI requires special initialization
-                if OCIEmbeddingProvider is None:
-                    raise ImportError("OCI provider not available. Install oci package.")
                 from .oci import create_standalone_oci_provider
 
                 return create_standalone_oci_provider(
@@ -6,13 +6,49 @@ useful for testing without external dependencies.
 """
 
 import asyncio
-import hashlib
+import zlib
+from collections import OrderedDict
 from typing import Any
 
 import numpy as np
 
+from ..constants import MOCK_EMBEDDING_CACHE_SIZE, MOCK_THREAD_BATCH_SIZE
 from .base import BaseEmbeddingProvider, EmbeddingResult
 
+# Available mock models. The dicts are shared between calls and must not be mutated.
+_MOCK_MODELS: tuple[dict[str, Any], ...] = (
+    {
+        "id": "mock-384d",
+        "dimensions": 384,
+        "description": "Mock 384-dimensional embeddings (lightweight)",
+        "max_tokens": 8192,
+        "languages": ["any"],
+    },
+    {
+        "id": "mock-768d",
+        "dimensions": 768,
+        "description": "Mock 768-dimensional embeddings (standard)",
+        "max_tokens": 8192,
+        "languages": ["any"],
+    },
+    {
+        "id": "mock-1024d",
+        "dimensions": 1024,
+        "description": "Mock 1024-dimensional embeddings (high-quality)",
+        "max_tokens": 8192,
+        "languages": ["any"],
+    },
+)
+
+
+def _text_seed(text: str) -> int:
+    """Derive a deterministic 32-bit RNG seed from the text.
+
+    The seed needs no collision resistance, so a CRC32 is used rather than a
+    cryptographic hash.
+    """
+    return zlib.crc32(text.encode())
+
 
 class MockEmbeddingProvider(BaseEmbeddingProvider):
     """Mock embedding provider that generates deterministic embeddings."""
@@ -27,7 +63,69 @@ class MockEmbeddingProvider(BaseEmbeddingProvider):
         """
         self.dimension = dimension
         self.delay = delay
+        # Normalized embeddings of recently embedded texts, oldest first. Entries are
+        # only added and evicted (atomic operations), so large batches computed in a
+        # worker thread can share it with calls on the event loop.
+        self._cache: OrderedDict[str, np.ndarray] = OrderedDict()
         super().__init__(model_id or f"mock-{dimension}d")
+        # Model info is fixed for the provider's lifetime, so build it once
+        self._model_info = {
+            "id": self.model_id,
+            "dimension": self.dimension,  # Fixed: was "dimensions"
+            "dimensions": self.dimension,  # Keep for backward compatibility
+            "provider": "mock",
+            "description": "Mock embedding provider for testing",
+            "max_tokens": 8192,  # Arbitrary large value for testing
+            "languages": ["any"],
+        }
+
+    def _embedding_matrix(self, texts: list[str]) -> np.ndarray:
+        """Return one normalized float32 row per text, seeded from the text.
+
+        float32 matches what vector stores index, so callers don't have to convert.
+        """
+        embeddings = np.empty((len(texts), self.dimension), dtype=np.float32)
+        cache = self._cache
+        drawn = []
+        for i, text in enumerate(texts):
+            cached = cache.get(text)
+            if cached is not None:
+                embeddings[i] = cached
+                continue
+            rng = np.random.default_rng(_text_seed(text))
+            rng.standard_normal(dtype=np.float32, out=embeddings[i])
+            drawn.append(i)
+
+        if drawn:
+            rows = embeddings[drawn]
+            rows /= np.linalg.norm(rows, axis=1, keepdims=True)
+            embeddings[drawn] = rows
+            # Embeddings are deterministic per text, so remember the newly drawn ones.
+            # Only the rows that can survive eviction are kept, each copied so the
+            # cache never pins the batch-sized array.
+            for i, row in zip(
+                drawn[-MOCK_EMBEDDING_CACHE_SIZE:],
+                rows[-MOCK_EMBEDDING_CACHE_SIZE:],
+                strict=True,
+            ):
+                cache[texts[i]] = row.copy()
+            while len(cache) > MOCK_EMBEDDING_CACHE_SIZE:
+                cache.popitem(last=False)
+        return embeddings
+
+    def _embed_sync(self, texts: list[str]) -> list[EmbeddingResult]:
+        """Build the embedding results for texts; the CPU-bound core of both embed calls."""
+        dimension = self.dimension
+        model = self.model_id
+        return [
+            EmbeddingResult(
+                text=text,
+                embedding=embedding,
+                model=model,
+                metadata={"provider": "mock", "dimension": dimension},
+            )
+            for text, embedding in zip(texts, self._embedding_matrix(texts), strict=True)
+        ]
 
     async def embed_text(self, text: str) -> EmbeddingResult:
         """Generate a mock embedding for text.
@@ -38,72 +136,50 @@ class MockEmbeddingProvider(BaseEmbeddingProvider):
         Returns:
             EmbeddingResult with mock embedding
         """
-        # Generate deterministic embedding based on text hash
-        text_hash = hashlib.sha256(text.encode()).hexdigest()
-
-        # Use hash to seed random number generator for consistency
-        seed = int(text_hash[:8], 16)
-        np.random.seed(seed)
-
-        # Generate normalized random vector
-        embedding = np.random.randn(self.dimension)
-        embedding = embedding / np.linalg.norm(embedding)
+        result = self._embed_sync([text])[0]
 
         # Simulate API delay if configured
         if self.delay > 0:
             await asyncio.sleep(self.delay)
 
-        return EmbeddingResult(
-            text=text,
-            embedding=embedding,
-            model=self.model_id,
-            metadata={"provider": "mock", "dimension": self.dimension},
-        )
+        return result
+
+    async def embed_batch(self, texts: list[str]) -> list[EmbeddingResult]:
+        """Generate mock embeddings for a batch of texts.
+
+        The embeddings are drawn into one matrix and normalized together, without
+        awaiting embed_text per text; each row matches what embed_text returns.
 
-    # embed_batch is inherited from base class
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            List of EmbeddingResults, in input order
+        """
+        if len(texts) >= MOCK_THREAD_BATCH_SIZE:
+            # Large batches are CPU-bound; keep them off the event loop
+            results = await asyncio.to_thread(self._embed_sync, texts)
+        else:
+            results = self._embed_sync(texts)
+
+        # Simulate API delay if configured (one request per batch)
+        if self.delay > 0:
+            await asyncio.sleep(self.delay)
+
+        return results
 
     def get_model_info(self) -> dict[str, Any]:
         """Get information about the mock model.
 
         Returns:
-            Dictionary with model information
+            Dictionary with model information (shared; must not be mutated)
         """
-        return {
-            "id": self.model_id,
-            "dimension": self.dimension,  # Fixed: was "dimensions"
-            "dimensions": self.dimension,  # Keep for backward compatibility
-            "provider": "mock",
-            "description": "Mock embedding provider for testing",
-            "max_tokens": 8192,  # Arbitrary large value for testing
-            "languages": ["any"],
-        }
+        return self._model_info
 
     async def list_models(self) -> list[dict[str, Any]]:
         """List available mock models.
 
         Returns:
-            List of model information dictionaries
+            List of model information dictionaries (shared; must not be mutated)
         """
-        return [
-            {
-                "id": "mock-384d",
-                "dimensions": 384,
-                "description": "Mock 384-dimensional embeddings (lightweight)",
-                "max_tokens": 8192,
-                "languages": ["any"],
-            },
-            {
-                "id": "mock-768d",
-                "dimensions": 768,
-                "description": "Mock 768-dimensional embeddings (standard)",
-                "max_tokens": 8192,
-                "languages": ["any"],
-            },
-            {
-                "id": "mock-1024d",
-                "dimensions": 1024,
-                "description": "Mock 1024-dimensional embeddings (high-quality)",
-                "max_tokens": 8192,
-                "languages": ["any"],
-            },
-        ]
+        return list(_MOCK_MODELS)
@@ -20,7 +20,14 @@ from oci.generative_ai_inference.models import (
 )
 
 from .base import BaseEmbeddingProvider, EmbeddingResult
-from .oci_constants import DEFAULT_COMPARTMENT_ID, DEFAULT_MODEL, MODEL_INFO, MODEL_MAPPING
+from .oci_constants import (
+    DEFAULT_COMPARTMENT_ID,
+    DEFAULT_MODEL,
+    MAX_CONCURRENT_REQUESTS,
+    MAX_INPUTS_PER_REQUEST,
+    MODEL_INFO,
+    MODEL_MAPPING,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +55,7 @@ class OCIEmbeddingProvider(BaseEmbeddingProvider):
         region: str | None = None,
         service_endpoint: str | None = None,
         cache_duration_hours: int = 24,
+        max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
     ):
         """Initialize OCI embedding provider.
 
@@ -60,6 +68,7 @@ class OCIEmbeddingProvider(BaseEmbeddingProvider):
             region: OCI region (if not provided, uses config file)
             service_endpoint: OCI service endpoint (optional)
             cache_duration_hours: How long to cache model lists (default: 24)
+            max_concurrent_requests: Sub-batch requests sent at once for large batches
         """
         # Use defaults if not provided
         if compartment_id is None:
@@ -78,6 +87,7 @@ class OCIEmbeddingProvider(BaseEmbeddingProvider):
         self.compartment_id = compartment_id
         self.service_endpoint = service_endpoint
         self.cache_duration = timedelta(hours=cache_duration_hours)
+        self.max_concurrent_requests = max_concurrent_requests
         self._client = None
         self._models_cache = None
         self._cache_timestamp = None
@@ -117,9 +127,37 @@ class OCIEmbeddingProvider(BaseEmbeddingProvider):
         results = await self.embed_batch([text])
         return results[0]
 
+    async def _embed_request(self, texts: list[str]) -> list[list[float]]:
+        """Send one embed request for at most MAX_INPUTS_PER_REQUEST texts.
+
+        Args:
+            texts: Texts to embed in this request
+
+        Returns:
+            Embedding vectors, in input order
+        """
+        embed_details = EmbedTextDetails(
+            inputs=texts,
+            serving_mode=OnDemandServingMode(
+                model_id=f"ocid1.generativeaimodel.oc1.us-chicago-1.{self.model_id}"
+            ),
+            compartment_id=self.compartment_id,
+            # Add truncate parameter to handle long texts
+            truncate="END",
+        )
+
+        # The SDK client is blocking, so run the request in the default executor
+        response = await asyncio.get_event_loop().run_in_executor(
+            None, lambda: self.client.embed_text(embed_details)
+        )
+        return response.data.embeddings
+
     async def embed_batch(self, texts: list[str]) -> list[EmbeddingResult]:
         """Embed a batch of texts using OCI GenAI.
 
+        Batches larger than the per-request input limit are split into sub-batches
+        that are sent concurrently, bounded by max_concurrent_requests.
+
         Args:
             texts: List of texts to embed
 
@@ -127,40 +165,39 @@ class OCIEmbeddingProvider(BaseEmbeddingProvider):
             List of EmbeddingResults
         """
         try:
-            # Create request
-            embed_details = EmbedTextDetails(
-                inputs=texts,
-                serving_mode=OnDemandServingMode(
-                    model_id=f"ocid1.generativeaimodel.oc1.us-chicago-1.{self.model_id}"
-                ),
-                compartment_id=self.compartment_id,
-                # Add truncate parameter to handle long texts
-                truncate="END",
-            )
+            if len(texts) <= MAX_INPUTS_PER_REQUEST:
+                embeddings = await self._embed_request(texts)
+            else:
+                semaphore = asyncio.Semaphore(self.max_concurrent_requests)
 
-            # Make request
-            response = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: self.client.embed_text(embed_details)
-            )
+                async def embed_with_semaphore(chunk: list[str]) -> list[list[float]]:
+                    async with semaphore:
+                        return await self._embed_request(chunk)
 
-            # Extract embeddings
-            results = []
-            for i, text in enumerate(texts):
-                embedding = np.array(response.data.embeddings[i])
-                results.append(
-                    EmbeddingResult(
-                        text=text,
-                        embedding=embedding,
-                        model=self.model_id,
-                        metadata={
-                            "provider": "oci",
-                            "truncated": len(text.split())
-                            > MODEL_INFO.get(self.model_id, {}).get("max_tokens", 512),
-                        },
+                # gather returns the sub-batches in submission order
+                chunks = await asyncio.gather(
+                    *(
+                        embed_with_semaphore(texts[i : i + MAX_INPUTS_PER_REQUEST])
+                        for i in range(0, len(texts), MAX_INPUTS_PER_REQUEST)
                     )
                 )
-
-            return results
+                embeddings = [embedding for chunk in chunks for embedding in chunk]
+
+            # Convert all vectors in one call; each result's embedding is a row view
+            matrix = np.asarray(embeddings, dtype=np.float32)
+            max_tokens = MODEL_INFO.get(self.model_id, {}).get("max_tokens", 512)
+            return [
+                EmbeddingResult(
+                    text=text,
+                    embedding=embedding,
+                    model=self.model_id,
+                    metadata={
+                        "provider": "oci",
+                        "truncated": len(text.split()) > max_tokens,
+                    },
+                )
+                for text, embedding in zip(texts, matrix, strict=True)
+            ]
 
         except Exception as e:
             logger.error(f"Error embedding texts with OCI: {str(e)}")
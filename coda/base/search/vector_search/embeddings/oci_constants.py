@@ -52,6 +52,11 @@ MODEL_INFO: dict[str, dict[str, Any]] = {
     },
 }
 
+# Request limits: the embed API accepts at most 96 inputs per request, so larger
+# batches are split and up to MAX_CONCURRENT_REQUESTS sub-batches run at once
+MAX_INPUTS_PER_REQUEST: int = 96
+MAX_CONCURRENT_REQUESTS: int = 5
+
 # Default configuration
 DEFAULT_MODEL = "cohere.embed-english-v3.0"
 DEFAULT_COMPARTMENT_ID = (
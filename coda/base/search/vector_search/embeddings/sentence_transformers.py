@@ -161,22 +161,19 @@ class SentenceTransformersProvider(BaseEmbeddingProvider):
         )
 
         # Create results
-        results = []
-        for text, embedding in zip(texts, embeddings, strict=False):
-            results.append(
-                EmbeddingResult(
-                    text=text,
-                    embedding=embedding,
-                    model=self.model_id,
-                    metadata={
-                        "provider": "sentence-transformers",
-                        "dimension": len(embedding),
-                        "normalized": self.normalize_embeddings,
-                    },
-                )
+        return [
+            EmbeddingResult(
+                text=text,
+                embedding=embedding,
+                model=self.model_id,
+                metadata={
+                    "provider": "sentence-transformers",
+                    "dimension": len(embedding),
+                    "normalized": self.normalize_embeddings,
+                },
             )
-
-        return results
+            for text, embedding in zip(texts, embeddings, strict=False)
+        ]
 
     def get_model_info(self) -> dict[str, Any]:
         """Get information about the current model.
@@ -1,7 +1,7 @@
 """Context management for sessions with intelligent windowing."""
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Final
 
 try:
     import tiktoken
@@ -12,6 +12,48 @@ except ImportError:
 
 from coda.base.providers.base import BaseProvider
 
+# Tokens added per message for role and formatting
+MESSAGE_TOKEN_OVERHEAD: Final[int] = 4
+
+# Fallback context limits for when provider info is not available. Shared by all
+# context managers, so it must not be mutated.
+FALLBACK_CONTEXT_LIMITS: Final[dict[str, int]] = {
+    # OCI GenAI models
+    "cohere.command-r-plus": 128000,
+    "cohere.command-r-16k": 16000,
+    "cohere.command": 4000,
+    "meta.llama-3.1-405b": 128000,
+    "meta.llama-3.1-70b": 128000,
+    "meta.llama-3.3-70b": 128000,
+    "meta.llama-4-3-90b": 131072,
+    "xai.grok-3": 131072,
+    # OpenAI models
+    "gpt-4": 8192,
+    "gpt-4-32k": 32768,
+    "gpt-4-turbo": 128000,
+    "gpt-4-turbo-preview": 128000,
+    "gpt-3.5-turbo": 4096,
+    "gpt-3.5-turbo-16k": 16384,
+    # Default
+    "default": 4096,
+}
+
+# Common programming keywords looked for when summarizing topics
+TOPIC_KEYWORDS: Final[tuple[str, ...]] = (
+    "function",
+    "class",
+    "database",
+    "api",
+    "error",
+    "bug",
+    "feature",
+    "test",
+    "deploy",
+    "config",
+    "security",
+    "performance",
+)
+
 
 @dataclass
 class ContextWindow:
@@ -38,26 +80,7 @@ class ContextManager:
         self._init_tokenizer()
 
         # Fallback context limits for when provider info is not available
-        self.fallback_context_limits = {
-            # OCI GenAI models
-            "cohere.command-r-plus": 128000,
-            "cohere.command-r-16k": 16000,
-            "cohere.command": 4000,
-            "meta.llama-3.1-405b": 128000,
-            "meta.llama-3.1-70b": 128000,
-            "meta.llama-3.3-70b": 128000,
-            "meta.llama-4-3-90b": 131072,
-            "xai.grok-3": 131072,
-            # OpenAI models
-            "gpt-4": 8192,
-            "gpt-4-32k": 32768,
-            "gpt-4-turbo": 128000,
-            "gpt-4-turbo-preview": 128000,
-            "gpt-3.5-turbo": 4096,
-            "gpt-3.5-turbo-16k": 16384,
-            # Default
-            "default": 4096,
-        }
+        self.fallback_context_limits = FALLBACK_CONTEXT_LIMITS
 
     def _init_tokenizer(self):
         """Initialize the tokenizer for token counting."""
@@ -100,13 +123,8 @@ class ContextManager:
         Returns:
             Token count including overhead
         """
-        # Message overhead (role, formatting)
-        overhead = 4
-
-        # Count content tokens
-        content_tokens = self.count_tokens(message.get("content", ""))
-
-        return overhead + content_tokens
+        # Message overhead (role, formatting) plus content tokens
+        return MESSAGE_TOKEN_OVERHEAD + self.count_tokens(message.get("content", ""))
 
     def get_model_context_limit(self, model: str) -> int:
         """Get context limit for a model.
@@ -260,27 +278,11 @@ class ContextManager:
         # In production, this could use NLP or LLM
         topics = []
 
-        # Common programming keywords to look for
-        keywords = [
-            "function",
-            "class",
-            "database",
-            "api",
-            "error",
-            "bug",
-            "feature",
-            "test",
-            "deploy",
-            "config",
-            "security",
-            "performance",
-        ]
-
         # Count keyword occurrences
         keyword_counts = {}
         for msg in messages:
             content = msg.get("content", "").lower()
-            for keyword in keywords:
+            for keyword in TOPIC_KEYWORDS:
                 if keyword in content:
                     keyword_counts[keyword] = keyword_counts.get(keyword, 0) + 1
 
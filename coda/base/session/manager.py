@@ -146,12 +146,39 @@ class SessionManager:
         Returns:
             Created message object
         """
-        # Normalize content to string if it's not already
-        if not isinstance(content, str):
-            if hasattr(content, "content"):
-                content = content.content
-            else:
-                content = str(content)
+        return self.add_messages(
+            session_id,
+            [
+                {
+                    "role": role,
+                    "content": content,
+                    "model": model,
+                    "provider": provider,
+                    "metadata": metadata,
+                    "tool_calls": tool_calls,
+                    "attachments": attachments,
+                    "token_usage": token_usage,
+                    "cost": cost,
+                }
+            ],
+        )[0]
+
+    def add_messages(self, session_id: str, messages: list[dict[str, Any]]) -> list[Message]:
+        """Add several messages to a session in a single transaction.
+
+        Saving a whole conversation this way looks up the sequence number, updates the
+        session statistics and commits once, instead of once per message.
+
+        Args:
+            session_id: Session ID
+            messages: Dicts with the keyword arguments accepted by add_message
+                (role and content required)
+
+        Returns:
+            Created message objects, in the order given
+        """
+        if not messages:
+            return []
 
         with self.db.get_session() as db:
             # Get next sequence number
@@ -164,34 +191,61 @@ class SessionManager:
 
             sequence = (last_msg.sequence + 1) if last_msg else 1
 
-            # Create message
-            message = Message(
-                session_id=session_id,
-                sequence=sequence,
-                role=role,
-                content=content,
-                model=model,
-                provider=provider,
-                message_metadata=metadata or {},
-                tool_calls=tool_calls,
-                attachments=attachments,
-                search_content=self._prepare_search_content(content),
-                prompt_tokens=token_usage.get("prompt_tokens") if token_usage else None,
-                completion_tokens=token_usage.get("completion_tokens") if token_usage else None,
-                total_tokens=token_usage.get("total_tokens") if token_usage else None,
-                cost=cost,
-            )
-            db.add(message)
+            created = []
+            total_tokens = 0
+            total_cost = 0
+            for msg in messages:
+                content = msg["content"]
+                # Normalize content to string if it's not already
+                if not isinstance(content, str):
+                    if hasattr(content, "content"):
+                        content = content.content
+                    else:
+                        content = str(content)
+
+                token_usage = msg.get("token_usage")
+                cost = msg.get("cost")
+
+                # Create message
+                message = Message(
+                    session_id=session_id,
+                    sequence=sequence,
+                    role=msg["role"],
+                    content=content,
+                    model=msg.get("model"),
+                    provider=msg.get("provider"),
+                    message_metadata=msg.get("metadata") or {},
+                    tool_calls=msg.get("tool_calls"),
+                    attachments=msg.get("attachments"),
+                    search_content=self._prepare_search_content(content),
+                    prompt_tokens=token_usage.get("prompt_tokens") if token_usage else None,
+                    completion_tokens=(
+                        token_usage.get("completion_tokens") if token_usage else None
+                    ),
+                    total_tokens=token_usage.get("total_tokens") if token_usage else None,
+                    cost=cost,
+                )
+                db.add(message)
+                created.append(message)
+                sequence += 1
+
+                if token_usage and token_usage.get("total_tokens"):
+                    total_tokens += token_usage["total_tokens"]
+                if cost:
+                    total_cost += cost
+
+            # Assign message IDs for the FTS rows
+            db.flush()
 
             # Update session statistics
             session = db.query(Session).filter_by(id=session_id).first()
             if session:
-                session.message_count += 1
+                session.message_count += len(created)
                 session.accessed_at = datetime.utcnow()
-                if token_usage and token_usage.get("total_tokens"):
-                    session.total_tokens += token_usage["total_tokens"]
-                if cost:
-                    session.total_cost += cost
+                if total_tokens:
+                    session.total_tokens += total_tokens
+                if total_cost:
+                    session.total_cost += total_cost
 
             # Update FTS index
             db.execute(
@@ -201,17 +255,28 @@ class SessionManager:
                 VALUES (:msg_id, :session_id, :content, :role)
             """
                 ),
-                {"msg_id": message.id, "session_id": session_id, "content": content, "role": role},
+                [
+                    {
+                        "msg_id": message.id,
+                        "session_id": session_id,
+                        "content": message.content,
+                        "role": message.role,
+                    }
+                    for message in created
+                ],
             )
 
             db.commit()
-            db.refresh(message)
 
-            # Store the ID to avoid detachment issues
-            message_id = message.id
+            # Store the IDs to avoid detachment issues
+            message_ids = [message.id for message in created]
 
-            # Return a fresh copy
-            return db.query(Message).filter_by(id=message_id).first()
+            # Return fresh copies
+            by_id = {
+                message.id: message
+                for message in db.query(Message).filter(Message.id.in_(message_ids)).all()
+            }
+            return [by_id[message_id] for message_id in message_ids]
 
     def _prepare_search_content(self, content: str) -> str:
         """Prepare content for full-text search."""
@@ -7,8 +7,8 @@ All theme-specific constants are defined here to make the module self-contained.
 DARK: str = "dark"
 LIGHT: str = "light"
 
-# List of all available themes
-ALL_THEMES: list[str] = [
+# All available themes
+ALL_THEMES: tuple[str, ...] = (
     DARK,
     LIGHT,
-]
+)
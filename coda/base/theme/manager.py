@@ -32,6 +32,7 @@ class ThemeManager:
         self.current_theme_name = theme_name or ThemeNames.DARK
         self._current_theme: Theme | None = None
         self._custom_themes: dict[str, Theme] = {}
+        self._console: Console | None = None
 
     @property
     def current_theme(self) -> Theme:
@@ -72,6 +73,7 @@ class ThemeManager:
 
         self.current_theme_name = theme_name
         self._current_theme = None
+        self._console = None
 
     def get_console_theme(self) -> ConsoleTheme:
         """Get console theme configuration."""
@@ -82,7 +84,17 @@ class ThemeManager:
         return self.current_theme.prompt
 
     def get_console(self) -> "Console":
-        """Get a Rich console with the current theme applied."""
+        """Get a Rich console with the current theme applied.
+
+        The console is cached until the theme or quiet mode changes, so terminal
+        detection (TTY, size, color system) runs once rather than per caller.
+        """
+        if self._console is None:
+            self._console = self._create_console()
+        return self._console
+
+    def _create_console(self) -> "Console":
+        """Create a Rich console for the current theme."""
         from rich.console import Console
         from rich.theme import Theme as RichTheme
 
@@ -127,8 +139,9 @@ class ThemeManager:
         current_console = self.get_console_theme()
         current_console.quiet = quiet
 
-        # Reset cached theme so changes take effect
+        # Reset cached theme and console so changes take effect
         self._current_theme = None
+        self._console = None
 
     def is_quiet(self) -> bool:
         """Check if quiet mode is enabled."""
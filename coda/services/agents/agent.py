@@ -1,7 +1,9 @@
 """Core Agent implementation for Coda."""
 
 import asyncio
+import functools
 import json
+import threading
 from collections.abc import Callable
 
 from coda.base.providers.base import BaseProvider, Message, Role, Tool, ToolCall
@@ -17,6 +19,9 @@ from .agent_types import (
 )
 from .function_tool import FunctionTool
 
+# Marks the end of a provider stream drained by a worker thread
+_STREAM_END = object()
+
 
 class Agent:
     """
@@ -360,13 +365,12 @@ class Agent:
 
                 # Make request to provider
                 if supports_tools:
-                    # Use interruptible approach instead of asyncio.to_thread
-                    import concurrent.futures
-
-                    # Create a future for the provider call
-                    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
-                    try:
-                        future = executor.submit(
+                    # Use interruptible approach instead of asyncio.to_thread. The call
+                    # runs on the loop's shared default executor rather than a new
+                    # thread pool per step.
+                    future = asyncio.get_running_loop().run_in_executor(
+                        None,
+                        functools.partial(
                             self.provider.chat,
                             messages=messages,
                             model=self.model,
@@ -374,25 +378,24 @@ class Agent:
                             max_tokens=self.max_tokens,
                             tools=provider_tools,
                             **self.kwargs,
-                        )
+                        ),
+                    )
 
-                        # Poll for completion or interruption
-                        while not future.done():
-                            if interrupt_check and interrupt_check():
-                                future.cancel()  # This won't stop the actual provider call but prevents waiting
-                                if status:
-                                    status.stop()
-                                self._emit_warning("Response interrupted by user")
-                                return "Response interrupted.", messages
+                    # Poll for completion or interruption
+                    while not future.done():
+                        if interrupt_check and interrupt_check():
+                            future.cancel()  # This won't stop the actual provider call but prevents waiting
+                            if status:
+                                status.stop()
+                            self._emit_warning("Response interrupted by user")
+                            return "Response interrupted.", messages
 
-                            # Wait a short time before checking again
-                            await asyncio.sleep(self.INTERRUPT_CHECK_INTERVAL)
+                        # Wake as soon as the call finishes, or after the interval to
+                        # check for an interrupt again
+                        await asyncio.wait({future}, timeout=self.INTERRUPT_CHECK_INTERVAL)
 
-                        # Get the result
-                        response = future.result()
-                    finally:
-                        # Always clean up the executor
-                        executor.shutdown(wait=False)
+                    # Get the result
+                    response = future.result()
                 else:
                     # Use streaming for final response when no tools
                     stream = self.provider.chat_stream(
@@ -639,27 +642,70 @@ class Agent:
         Returns:
             The complete response content
         """
-        response_content = ""
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+
+        def drain():
+            # Provider streams are blocking iterators; read them in a worker thread so
+            # the event loop stays responsive between chunks
+            try:
+                for chunk in stream:
+                    if stop.is_set():
+                        break
+                    loop.call_soon_threadsafe(queue.put_nowait, chunk)
+            except Exception as e:
+                loop.call_soon_threadsafe(queue.put_nowait, e)
+            finally:
+                try:
+                    loop.call_soon_threadsafe(queue.put_nowait, _STREAM_END)
+                except RuntimeError:
+                    pass  # Loop already closed; nobody is waiting for the stream
+
+        loop.run_in_executor(None, drain)
+
+        parts = []
         is_first = first_chunk
 
-        for chunk in stream:
-            # Check for interrupt
-            if interrupt_check and interrupt_check():
-                if status:
-                    status.stop()
-                self._emit_warning("Response interrupted by user")
-                return ""  # Return empty string on interrupt
+        try:
+            while True:
+                if queue.empty():
+                    try:
+                        chunk = await asyncio.wait_for(
+                            queue.get(), timeout=self.INTERRUPT_CHECK_INTERVAL
+                        )
+                    except TimeoutError:
+                        chunk = None
+                else:
+                    chunk = queue.get_nowait()
 
-            if is_first:
-                # Stop status before printing response
-                if status:
-                    status.stop()
-                # Agent name prefix handled by event system
-                is_first = False
+                # Check for interrupt
+                if interrupt_check and interrupt_check():
+                    if status:
+                        status.stop()
+                    self._emit_warning("Response interrupted by user")
+                    return ""  # Return empty string on interrupt
+
+                if chunk is None:
+                    continue
+                if chunk is _STREAM_END:
+                    break
+                if isinstance(chunk, Exception):
+                    raise chunk
+
+                if is_first:
+                    # Stop status before printing response
+                    if status:
+                        status.stop()
+                    # Agent name prefix handled by event system
+                    is_first = False
 
-            self._emit_response_chunk(chunk.content)
-            response_content += chunk.content
+                self._emit_response_chunk(chunk.content)
+                parts.append(chunk.content)
+        finally:
+            stop.set()
 
+        response_content = "".join(parts)
         if response_content:
             # Streaming complete - add newline and emit completion
             self._emit_newline()
@@ -5,6 +5,7 @@ a complete configuration solution for Coda applications.
 """
 
 import os
+import tomllib
 from pathlib import Path
 from typing import Any
 
@@ -43,16 +44,8 @@ class AppConfig:
             from coda.base.config.models import ConfigSource
 
             # Parse TOML directly
-            try:
-                import tomllib
-
-                with open(config_path, "rb") as f:
-                    user_config = tomllib.load(f)
-            except ImportError:
-                import toml
-
-                with open(config_path) as f:
-                    user_config = toml.load(f)
+            with open(config_path, "rb") as f:
+                user_config = tomllib.load(f)
 
             # Add user config as a layer with higher priority
             # Use RUNTIME source to ensure it overrides defaults
@@ -184,23 +177,13 @@ class AppConfig:
 
     def get_data_dir(self) -> Path:
         """Get data directory path using XDG standards."""
-        xdg_data_home = os.environ.get("XDG_DATA_HOME")
-        if xdg_data_home:
-            data_dir = Path(xdg_data_home) / "coda"
-        else:
-            data_dir = Path.home() / ".local" / "share" / "coda"
-
+        data_dir = self.config.get_data_dir()
         data_dir.mkdir(parents=True, exist_ok=True)
         return data_dir
 
     def get_cache_dir(self) -> Path:
         """Get cache directory path using XDG standards."""
-        xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
-        if xdg_cache_home:
-            cache_dir = Path(xdg_cache_home) / "coda"
-        else:
-            cache_dir = Path.home() / ".cache" / "coda"
-
+        cache_dir = self.config.get_cache_dir()
         cache_dir.mkdir(parents=True, exist_ok=True)
         return cache_dir
 
@@ -13,7 +13,6 @@ from coda.base.search.vector_search.constants import (
     DEFAULT_MODELS,
     OLLAMA_HEALTH_TIMEOUT,
 )
-from coda.base.search.vector_search.embeddings import create_oci_provider_from_coda_config
 from coda.base.search.vector_search.embeddings.factory import create_embedding_provider
 from coda.base.search.vector_search.manager import SemanticSearchManager
 from coda.services.config import get_config_service
@@ -25,8 +24,14 @@ class CodaConfig:
 
     def __init__(self, config_dict: dict[str, Any]):
         self._dict = config_dict
-        for key, value in config_dict.items():
-            setattr(self, key, value)
+
+    def __getattr__(self, name: str) -> Any:
+        # Top-level keys are read through from the dict rather than copied onto the
+        # instance, so wrapping the full merged config costs nothing per call
+        try:
+            return self.__dict__["_dict"][name]
+        except KeyError:
+            raise AttributeError(name) from None
 
     def to_dict(self) -> dict[str, Any]:
         return self._dict
@@ -56,6 +61,10 @@ def _try_oci_provider(
         return None, "OCI not configured"
 
     try:
+        from coda.base.search.vector_search.embeddings.oci import (
+            create_oci_provider_from_coda_config,
+        )
+
         provider = create_oci_provider_from_coda_config(
             config_dict, model_id or DEFAULT_MODELS["oci"]
         )
@@ -148,7 +157,9 @@ def create_semantic_search_manager(
     """
     config = config or get_config()
     # Handle both CodaConfig objects and plain dicts
-    if hasattr(config, "config_dict"):
+    if isinstance(config, CodaConfig):
+        config_dict = config.to_dict()
+    elif hasattr(config, "config_dict"):
         config_dict = config.config_dict
     elif hasattr(config, "__dict__"):
         config_dict = config.__dict__
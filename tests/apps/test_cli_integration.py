@@ -107,6 +107,24 @@ def test_cli_entry_point():
         raise AssertionError(f"Failed to import CLI entry point: {e}") from e
 
 
+def test_cli_lazy_subcommands():
+    """Test that lazily registered subcommands are listed and resolvable."""
+    import click
+
+    from coda.apps.cli.cli import cli
+
+    ctx = click.Context(cli)
+
+    # Lazy subcommands should be listed alongside eagerly registered ones
+    assert "chat" in cli.list_commands(ctx)
+    assert "web" in cli.list_commands(ctx)
+
+    # Resolving the lazy subcommand should import it on demand
+    web = cli.get_command(ctx, "web")
+    assert isinstance(web, click.Command)
+    assert web.name == "web"
+
+
 def test_cli_theme_integration():
     """Test that CLI properly integrates with theme system."""
     from coda.apps.cli.interactive_cli import InteractiveCLI
@@ -167,6 +167,35 @@ def test_search_standalone_import():
     assert success, f"Search standalone import failed:\n{output}"
 
 
+def test_search_optional_providers_lazy():
+    """Test that optional embedding providers load on access from one source."""
+    test_code = """
+    import sys
+
+    from coda.base.search import vector_search
+    from coda.base.search.vector_search import embeddings
+
+    optional = ("OCIEmbeddingProvider", "OllamaEmbeddingProvider", "SentenceTransformersProvider")
+    assert set(optional) <= set(coda.base.search.__all__)
+    assert set(optional) <= set(vector_search.__all__)
+
+    # Nothing optional is imported until a provider is accessed
+    assert not any(
+        name.endswith((".oci", ".ollama", ".sentence_transformers")) for name in sys.modules
+    )
+
+    # The embeddings package only exports names whose dependencies are installed
+    assert all(getattr(embeddings, name) is not None for name in embeddings.__all__)
+
+    for name in optional:
+        provider = getattr(coda.base.search, name)
+        assert provider is getattr(vector_search, name) is getattr(embeddings, name)
+"""
+
+    success, output = run_isolated_import("coda.base.search", test_code)
+    assert success, f"Search optional provider import failed:\n{output}"
+
+
 def test_observability_standalone_import():
     """Test that observability module can be imported standalone."""
     test_code = """
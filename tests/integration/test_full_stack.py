@@ -80,6 +80,53 @@ def test_session_persistence_full_stack():
         assert sessions[0].message_count == 2
 
 
+def test_session_batched_messages():
+    """Test that a batch of messages is persisted like individual add_message calls."""
+    from coda.base.session import SessionDatabase, SessionManager
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        database = SessionDatabase(db_path=Path(tmpdir) / "test.db")
+        manager = SessionManager(database=database)
+        session = manager.create_session(name="batch", provider="test", model="test-model")
+
+        # An empty batch is a no-op
+        assert manager.add_messages(session.id, []) == []
+
+        batch = [
+            {
+                "role": "user" if i % 2 == 0 else "assistant",
+                "content": f"batched message keyword{i}",
+                "token_usage": {"prompt_tokens": 1, "completion_tokens": i, "total_tokens": i + 1},
+                "cost": 0.25,
+            }
+            for i in range(4)
+        ]
+        created = manager.add_messages(session.id, batch)
+        assert [message.sequence for message in created] == [1, 2, 3, 4]
+
+        # Single messages continue the sequence after the batch
+        manager.add_message(session.id, "user", "after the batch")
+        messages = manager.get_messages(session.id)
+        assert [message.sequence for message in messages] == [1, 2, 3, 4, 5]
+        assert messages[-1].content == "after the batch"
+
+        # Session statistics are summed across the batch
+        stored = manager.get_session(session.id)
+        assert stored.message_count == 5
+        assert stored.total_tokens == 1 + 2 + 3 + 4
+        assert stored.total_cost == 1.0
+
+        # Every batched message is indexed for full-text search
+        for i in range(4):
+            results = manager.search_sessions(f"keyword{i}")
+            assert len(results) == 1
+            found_session, found_messages = results[0]
+            assert found_session.id == session.id
+            assert [message.content for message in found_messages] == [
+                f"batched message keyword{i}"
+            ]
+
+
 def test_provider_with_config_integration():
     """Test that providers can be configured through the config system."""
     from coda.base.providers import ProviderFactory
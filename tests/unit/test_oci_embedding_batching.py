@@ -0,0 +1,84 @@
+"""Unit tests for OCI embedding sub-batching."""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from coda.base.search.vector_search.embeddings.oci import OCIEmbeddingProvider
+from coda.base.search.vector_search.embeddings.oci_constants import MAX_INPUTS_PER_REQUEST
+
+
+class RecordingEmbedClient:
+    """Stub OCI client that records request sizes and peak concurrency."""
+
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.request_sizes = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def embed_text(self, details):
+        with self._lock:
+            self.request_sizes.append(len(details.inputs))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+
+        # Encode each input's index in its vector so ordering can be checked
+        embeddings = [[float(text.split("-")[1]), 0.5] for text in details.inputs]
+        return SimpleNamespace(data=SimpleNamespace(embeddings=embeddings))
+
+
+@pytest.fixture
+def stub_client():
+    """Recording stub for the OCI inference client."""
+    return RecordingEmbedClient()
+
+
+def make_provider(client, max_concurrent_requests: int) -> OCIEmbeddingProvider:
+    """Create an OCI embedding provider that talks to the stub client."""
+    provider = OCIEmbeddingProvider(
+        compartment_id="test-compartment-id",
+        oci_config={},
+        max_concurrent_requests=max_concurrent_requests,
+    )
+    provider._client = client
+    return provider
+
+
+async def test_small_batch_uses_single_request(stub_client):
+    """Test that a batch within the input limit is sent as one request."""
+    provider = make_provider(stub_client, max_concurrent_requests=3)
+    texts = [f"text-{i}" for i in range(MAX_INPUTS_PER_REQUEST)]
+
+    results = await provider.embed_batch(texts)
+
+    assert stub_client.request_sizes == [MAX_INPUTS_PER_REQUEST]
+    assert [result.text for result in results] == texts
+
+
+async def test_large_batch_split_concurrently_in_order(stub_client):
+    """Test that large batches are split, bounded by the semaphore and kept in order."""
+    provider = make_provider(stub_client, max_concurrent_requests=3)
+    texts = [f"text-{i}" for i in range(1000)]
+
+    results = await provider.embed_batch(texts)
+
+    # 1000 inputs split into ten full sub-batches and a remainder of 40
+    assert len(stub_client.request_sizes) == 11
+    assert sorted(stub_client.request_sizes) == [40] + [MAX_INPUTS_PER_REQUEST] * 10
+
+    # Sub-batches overlap, but never beyond max_concurrent_requests
+    assert 1 < stub_client.peak <= 3
+
+    # Results line up with their inputs regardless of completion order
+    assert [result.text for result in results] == texts
+    assert [result.embedding[0] for result in results] == list(range(1000))
+    assert all(result.embedding.dtype == np.float32 for result in results)
+    assert all(result.metadata["provider"] == "oci" for result in results)